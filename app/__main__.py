@@ -0,0 +1,52 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import os
+import uvicorn
+
+from loguru import logger
+
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.database.events import create_driver
+from app.database.migrations import apply_migrations
+from app.database.pool import SessionPool
+
+
+async def _apply_migrations(settings: AppSettings) -> None:
+    driver = create_driver(settings)
+
+    try:
+        migrations = await apply_migrations(SessionPool(driver, settings.database_max_connection_pool_size))
+        logger.info("Applied {count} schema migration(s)", count=len(migrations))
+    finally:
+        await driver.close()
+
+
+def main() -> None:
+    # Invalid settings fail once here instead of in every worker process.
+    settings = get_app_settings()
+    settings.configure_logging()
+
+    # Workers would race each other through the migrations, so they are applied once before forking.
+    if settings.server_workers > 1 and settings.database_migrate_on_startup:
+        asyncio.run(_apply_migrations(settings))
+        os.environ["DATABASE_MIGRATE_ON_STARTUP"] = "false"
+
+    uvicorn.run("app.app:get_application", factory=True, **settings.server_kwargs)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,13 +15,16 @@
 from loguru import logger
 from typing import Callable
 from fastapi import Depends, HTTPException, Security, status
+from fastapi.requests import Request
 
 from app.api.dependencies.get_from_header import get_language
 from app.core.config import get_app_settings
 from app.core.settings.app import AppSettings
 from app.resources import strings_factory
 from app.services.auth_token_header import AuthTokenHeader
+from app.services.key_set import KeySet
 from app.services.token import get_user_id_from_access_token
+from app.services.token_cache import TokenCache
 
 
 HEADER_KEY = "Authorization"
@@ -31,6 +34,14 @@ def get_current_user_authorizer() -> Callable:
     return _get_user_id_from_token
 
 
+def get_key_set(request: Request) -> KeySet:
+    return request.app.state.key_set
+
+
+def get_token_cache(request: Request) -> TokenCache:
+    return request.app.state.token_cache
+
+
 def _get_authorization_header(
         language: str = Depends(get_language),
         api_key: str = Security(AuthTokenHeader(name=HEADER_KEY)),
@@ -53,11 +64,12 @@ def _get_authorization_header(
 def _get_user_id_from_token(
         language: str = Depends(get_language),
         token: str = Depends(_get_authorization_header),
-        settings: AppSettings = Depends(get_app_settings),
+        key_set: KeySet = Depends(get_key_set),
+        token_cache: TokenCache = Depends(get_token_cache),
 ) -> int:
     strings = strings_factory.get_language(language)
 
-    user_id = get_user_id_from_access_token(token, settings.public_key)
+    user_id = get_user_id_from_access_token(token, key_set, token_cache)
     if not user_id:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, strings.MALFORMED_PAYLOAD)
 
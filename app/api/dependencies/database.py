@@ -12,20 +12,59 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Callable, Type
+from typing import AsyncIterator, Callable, List, Type
 from fastapi import Depends
 from fastapi.requests import Request
 from neo4j import AsyncSession
 
+from app.api.dependencies.get_from_header import get_bookmarks
+from app.database.pool import SessionPool
 from app.database.repositories.base_repository import BaseRepository
+from app.services.cache import CacheBackend
+from app.services.read_model import EventReadModel
+from app.services.slow_query_log import SlowQueryLog
 
+READ_METHODS = ("GET", "HEAD")
 
-def _get_db_session(request: Request) -> AsyncSession:
-    return request.app.state.session
+
+def get_session_pool(request: Request) -> SessionPool:
+    return request.app.state.pool
+
+
+async def _get_db_session(
+        request: Request,
+        pool: SessionPool = Depends(get_session_pool),
+        bookmarks: List[str] = Depends(get_bookmarks),
+) -> AsyncIterator[AsyncSession]:
+    config = {}
+
+    # Waiting for bookmarks that are never reached is reported as transient, so reads fail fast
+    # instead of retrying for the whole budget; writes keep their retries for leader switches.
+    if bookmarks and request.method in READ_METHODS:
+        config["max_transaction_retry_time"] = 0
+
+    async with pool.session(bookmarks, **config) as session:
+        yield session
+
+
+def get_cache(request: Request) -> CacheBackend | None:
+    return request.app.state.cache
+
+
+def get_read_model(request: Request) -> EventReadModel | None:
+    return request.app.state.read_model
+
+
+def get_slow_query_log(request: Request) -> SlowQueryLog | None:
+    return request.app.state.slow_query_log
 
 
 def get_repository(repo_type: Type[BaseRepository]) -> Callable[[AsyncSession], BaseRepository]:
-    def _get_repo(session=Depends(_get_db_session)) -> BaseRepository:
-        return repo_type(session)
+    def _get_repo(
+            session=Depends(_get_db_session),
+            cache=Depends(get_cache),
+            slow_query_log=Depends(get_slow_query_log),
+    ) -> BaseRepository:
+        return repo_type(session, cache, slow_query_log)
 
     return _get_repo
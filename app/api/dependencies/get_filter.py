@@ -12,13 +12,46 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
+from typing import Literal
 from fastapi import Query
 
-from app.models.schemas.event import DEFAULT_EVENTS_LIMIT, DEFAULT_EVENTS_OFFSET, EventsFilter
+from app.models.schemas.event import DEFAULT_EVENTS_LIMIT, DEFAULT_EVENTS_OFFSET, EventsFilter, EventsSearchFilter
 
 
 def get_events_filter(
         limit: int = Query(DEFAULT_EVENTS_LIMIT, ge=1),
         offset: int = Query(DEFAULT_EVENTS_OFFSET, ge=0),
+        cursor: str | None = Query(None),
+        latitude: float | None = Query(None, alias="lat", ge=-90, le=90),
+        longitude: float | None = Query(None, alias="lon", ge=-180, le=180),
+        radius_km: float | None = Query(None, gt=0),
+        starts_after: datetime | None = Query(None),
+        starts_before: datetime | None = Query(None),
+        upcoming: bool = Query(True),
 ) -> EventsFilter:
-    return EventsFilter(limit=limit, offset=offset)
+    return EventsFilter(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        starts_after=starts_after,
+        starts_before=starts_before,
+        upcoming=upcoming,
+    )
+
+
+def get_events_search_filter(
+        query: str = Query(alias="q", min_length=1),
+        language: Literal["en", "ru"] | None = Query(None, alias="lang"),
+        limit: int = Query(DEFAULT_EVENTS_LIMIT, ge=1),
+        offset: int = Query(DEFAULT_EVENTS_OFFSET, ge=0),
+) -> EventsSearchFilter:
+    return EventsSearchFilter(
+        query=query,
+        language=language,
+        limit=limit,
+        offset=offset,
+    )
@@ -12,10 +12,46 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from fastapi import Header
+import re
+
+from typing import List
+from fastapi import Depends, Header, HTTPException, status
+
+from app.resources import strings_factory
+
+BOOKMARKS_HEADER = "X-Bookmarks"
+BOOKMARK_PATTERN = re.compile(r"[A-Za-z0-9:+/=_.-]{1,512}")
+MAX_BOOKMARKS = 16
 
 
 def get_language(
         language: str = Header(default="en", alias="Accept-Language"),
 ) -> str:
     return language
+
+
+def get_if_none_match(
+        if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+) -> str | None:
+    return if_none_match
+
+
+def get_accept(
+        accept: str | None = Header(default=None, alias="Accept"),
+) -> str | None:
+    return accept
+
+
+def get_bookmarks(
+        bookmarks: str | None = Header(default=None, alias=BOOKMARKS_HEADER),
+        language: str = Depends(get_language),
+) -> List[str]:
+    if not bookmarks:
+        return []
+
+    values = [bookmark.strip() for bookmark in bookmarks.split(",") if bookmark.strip()]
+    if len(values) > MAX_BOOKMARKS or not all(BOOKMARK_PATTERN.fullmatch(value) for value in values):
+        strings = strings_factory.get_language(language)
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_BOOKMARKS)
+
+    return values
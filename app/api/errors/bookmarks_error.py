@@ -0,0 +1,28 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from fastapi import HTTPException, status
+from fastapi.requests import Request
+from fastapi.responses import Response
+
+from app.api.errors.http_error import http_error_handler
+from app.database.errors import InvalidBookmarks
+from app.resources import strings_factory
+
+
+async def bookmarks_error_handler(request: Request, _: InvalidBookmarks) -> Response:
+    strings = strings_factory.get_language(request.headers.get("Accept-Language", "en"))
+
+    return await http_error_handler(request, HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_BOOKMARKS))
@@ -12,14 +12,25 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import lru_cache
 from fastapi import HTTPException
 from fastapi.requests import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from app.api.responses.wrapper_response import render_wrapper_response
 from app.models.schemas.wrapper import WrapperResponse
 
 
-async def http_error_handler(_: Request, exc: HTTPException) -> JSONResponse:
+@lru_cache(maxsize=256)
+def _render_error(message: str) -> bytes:
+    return render_wrapper_response(WrapperResponse(success=False, message=message))
+
+
+async def http_error_handler(_: Request, exc: HTTPException) -> Response:
+    # Messages come from the localized string tables, so each body is rendered once.
+    if isinstance(exc.detail, str):
+        return Response(_render_error(exc.detail), status_code=exc.status_code, media_type=JSONResponse.media_type)
+
     return JSONResponse(
         content=WrapperResponse(success=False, message=exc.detail).model_dump(),
         status_code=exc.status_code
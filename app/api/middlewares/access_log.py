@@ -0,0 +1,65 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import random
+import time
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class AccessLogMiddleware:
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0, slow_threshold: float = 1.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        started_at = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started_at
+
+            if self.is_logged(status_code, duration):
+                logger.log(
+                    "WARNING" if status_code >= 500 else "INFO",
+                    "{method} {path} {status_code} {duration_ms:.1f} ms",
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    duration_ms=duration * 1000,
+                )
+
+    def is_logged(self, status_code: int, duration: float) -> bool:
+        # Server errors and slow requests are always kept, the rest is sampled.
+        if status_code >= 500 or duration >= self.slow_threshold:
+            return True
+
+        return random.random() < self.sample_rate
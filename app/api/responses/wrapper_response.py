@@ -0,0 +1,87 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import json
+import math
+
+from typing import Any, Dict, Iterator, Type
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import SchemaSerializer
+
+from app.models.domain.event import Event
+from app.models.schemas.event import EventResponse, EventsResponse, EventsSearchResponse
+from app.models.schemas.wrapper import WrapperResponse
+
+PAYLOAD_SERIALIZERS: Dict[Type[Any], SchemaSerializer] = {
+    EventResponse: EventResponse.__pydantic_serializer__,
+    EventsResponse: EventsResponse.__pydantic_serializer__,
+    EventsSearchResponse: EventsSearchResponse.__pydantic_serializer__,
+}
+
+MESSAGE_SERIALIZER: SchemaSerializer = TypeAdapter(str).serializer
+
+
+def _is_plain_float(value: float) -> bool:
+    # json.dumps switches to exponent notation outside this range and formats it differently from pydantic-core.
+    return value == 0 or (math.isfinite(value) and 1e-4 <= abs(value) < 1e16)
+
+
+def _get_floats(payload: Any) -> Iterator[float]:
+    if isinstance(payload, EventsSearchResponse):
+        for result in payload.results:
+            yield result.score
+            yield from _get_coordinates(result.event)
+    elif isinstance(payload, EventResponse):
+        yield from _get_coordinates(payload.event)
+    else:
+        for event in payload.events:
+            yield from _get_coordinates(event)
+
+
+def _get_coordinates(event: Event) -> Iterator[float]:
+    yield event.location.latitude
+    yield event.location.longitude
+
+
+def render_wrapper_response(content: WrapperResponse) -> bytes:
+    serializer = PAYLOAD_SERIALIZERS.get(type(content.payload))
+
+    if serializer is None or not all(_is_plain_float(value) for value in _get_floats(content.payload)):
+        return json.dumps(
+            content.model_dump(mode="json", by_alias=True),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    return b"".join((
+        b'{"success":',
+        b"true" if content.success else b"false",
+        b',"payload":',
+        serializer.to_json(content.payload, by_alias=True),
+        b',"message":',
+        MESSAGE_SERIALIZER.to_json(content.message),
+        b"}",
+    ))
+
+
+class WrapperJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, WrapperResponse):
+            return render_wrapper_response(content)
+
+        return super().render(content)
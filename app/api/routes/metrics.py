@@ -0,0 +1,70 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from fastapi import APIRouter, Depends, Response, status
+
+from app.api.dependencies.authentication import get_token_cache
+from app.api.dependencies.database import get_cache, get_read_model, get_session_pool
+from app.database.pool import SessionPool
+from app.services import metrics
+from app.services.cache import CacheBackend
+from app.services.read_model import EventReadModel
+from app.services.token_cache import TokenCache
+
+router = APIRouter()
+
+
+def _set_cache_metrics(name: str, hits: int, misses: int, size: int | None) -> None:
+    metrics.CACHE_HITS.set(hits, name)
+    metrics.CACHE_MISSES.set(misses, name)
+    metrics.CACHE_HIT_RATIO.set(hits / (hits + misses) if hits + misses else 0.0, name)
+
+    if size is not None:
+        metrics.CACHE_SIZE.set(size, name)
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK, name="metrics:get-metrics", include_in_schema=False)
+async def get_metrics(
+        pool: SessionPool | None = Depends(get_session_pool),
+        token_cache: TokenCache = Depends(get_token_cache),
+        cache: CacheBackend | None = Depends(get_cache),
+        read_model: EventReadModel | None = Depends(get_read_model),
+) -> Response:
+    if pool is not None:
+        pool_stats = pool.stats()
+        metrics.POOL_MAX_SIZE.set(pool_stats.max_size)
+        metrics.POOL_CONNECTIONS.set(pool_stats.in_use, "in_use")
+        metrics.POOL_CONNECTIONS.set(pool_stats.idle, "idle")
+        metrics.SESSIONS_ACTIVE.set(pool_stats.active_sessions)
+        metrics.SESSIONS_OPENED.set(pool_stats.opened_sessions)
+
+    token_cache_stats = token_cache.stats()
+    _set_cache_metrics("token", token_cache_stats.hits, token_cache_stats.misses, token_cache_stats.size)
+
+    if cache is not None:
+        cache_stats = cache.stats()
+        _set_cache_metrics("event", cache_stats.hits, cache_stats.misses, cache_stats.size)
+
+    if read_model is not None:
+        read_model_stats = read_model.stats()
+        metrics.READ_MODEL_SIZE.set(read_model_stats.size)
+        metrics.READ_MODEL_SYNC_ERRORS.set(read_model_stats.sync_errors)
+
+        if read_model_stats.sync_age_seconds is not None:
+            metrics.READ_MODEL_SYNC_AGE.set(read_model_stats.sync_age_seconds)
+        if read_model_stats.change_lag_seconds is not None:
+            metrics.READ_MODEL_CHANGE_LAG.set(read_model_stats.change_lag_seconds)
+
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
@@ -14,8 +14,9 @@
 
 from fastapi import APIRouter
 
-from app.api.routes.v1 import events
+from app.api.routes.v1 import events, system
 
 router = APIRouter(prefix="/v1")
 
 router.include_router(events.router, tags=["Events"], prefix="/events")
+router.include_router(system.router, tags=["System"], prefix="/system")
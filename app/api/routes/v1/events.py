@@ -12,17 +12,51 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple
+from fastapi import APIRouter, Depends, status, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from neo4j import READ_ACCESS
+from pydantic import ValidationError
 
 from app.api.dependencies.authentication import get_current_user_authorizer
-from app.api.dependencies.database import get_repository
-from app.api.dependencies.get_filter import get_events_filter
-from app.api.dependencies.get_from_header import get_language
+from app.api.dependencies.database import get_cache, get_read_model, get_repository, get_session_pool, get_slow_query_log
+from app.api.dependencies.get_filter import get_events_filter, get_events_search_filter
+from app.api.dependencies.get_from_header import BOOKMARKS_HEADER, get_accept, get_bookmarks, get_if_none_match, get_language
 from app.api.dependencies.get_from_path import get_event_id
+from app.api.responses.wrapper_response import WrapperJSONResponse
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.database.errors import EntityAccessDenied, EntityAlreadyExists, EntityCreateError, EntityDoesNotExists
+from app.database.pool import SessionPool
 from app.database.repositories.event_repository import EventRepository
-from app.models.schemas.event import EventsFilter, EventResponse, EventsResponse, EventCreate, EventUpdate
+from app.models.schemas.event import (
+    EVENT_BATCH_CREATED,
+    EVENT_BATCH_DUPLICATE,
+    EVENT_BATCH_FAILED,
+    EVENT_BATCH_INVALID,
+    EventBatchItemResult,
+    EventsBatchResponse,
+    EventsFilter,
+    EventResponse,
+    EventsResponse,
+    EventSearchResult,
+    EventsSearchFilter,
+    EventsSearchResponse,
+    EventCreate,
+    EventUpdate,
+)
 from app.models.schemas.wrapper import WrapperResponse
 from app.resources import strings_factory
+from app.resources.strings_en import StringsEN
+from app.services.cache import CacheBackend
+from app.services.cursor import decode_cursor, encode_cursor
+from app.services.etag import get_event_etag, get_events_etag, is_etag_matched
+from app.services.fulltext import escape_query
+from app.services.ndjson import NDJSON_MEDIA_TYPE, iterate_lines
+from app.services.read_model import EventReadModel
+from app.services.slow_query_log import SlowQueryLog
+from app.services.utc import to_utc, utc_now
 
 router = APIRouter()
 
@@ -36,27 +70,306 @@ async def create_event(
 ) -> WrapperResponse:
     strings = strings_factory.get_language(language)
 
-    if await event_repository.get_event_by_title(request.title):
+    try:
+        event = await event_repository.create_event_by_user_id(user_id, **dict(request))
+    except EntityAlreadyExists:
         raise HTTPException(status.HTTP_409_CONFLICT, strings.EVENT_IS_EXISTS)
-
-    event = await event_repository.create_event_by_user_id(user_id, **request.dict())
-    if not event:
+    except EntityCreateError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.EVENT_CREATE_ERROR)
 
-    return WrapperResponse(
-        payload=EventResponse(event=event)
+    return WrapperJSONResponse(
+        WrapperResponse(payload=EventResponse(event=event)),
+        headers=await _get_bookmarks_headers(event_repository),
     )
 
 
+@router.post("/batch", status_code=status.HTTP_200_OK, name="events:create-events-batch")
+async def create_events_batch(
+        request: Request,
+        language: str = Depends(get_language),
+        user_id: int = Depends(get_current_user_authorizer()),
+        settings: AppSettings = Depends(get_app_settings),
+        event_repository: EventRepository = Depends(get_repository(EventRepository)),
+) -> WrapperResponse:
+    strings = strings_factory.get_language(language)
+
+    if request.headers.get("Content-Type", "").startswith(NDJSON_MEDIA_TYPE):
+        items = iterate_lines(request.stream())
+    else:
+        try:
+            body = await request.json()
+        except ValueError:
+            body = None
+
+        if not isinstance(body, list):
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_EVENTS_BATCH)
+
+        items = _iterate_items(body)
+
+    results: List[EventBatchItemResult] = []
+    chunk: List[Tuple[int, EventCreate]] = []
+    titles: Set[str] = set()
+    index = 0
+
+    async for item in items:
+        event = _validate_item(index, item, titles, strings)
+        if isinstance(event, EventBatchItemResult):
+            results.append(event)
+        else:
+            chunk.append((index, event))
+
+        index += 1
+
+        if len(chunk) >= settings.events_batch_chunk_size:
+            results.extend(await _create_events_chunk(event_repository, user_id, chunk, strings))
+            chunk = []
+
+    if chunk:
+        results.extend(await _create_events_chunk(event_repository, user_id, chunk, strings))
+
+    results.sort(key=lambda result: result.index)
+
+    return WrapperJSONResponse(
+        WrapperResponse(
+            payload=EventsBatchResponse(
+                created=sum(result.status == EVENT_BATCH_CREATED for result in results),
+                duplicates=sum(result.status == EVENT_BATCH_DUPLICATE for result in results),
+                invalid=sum(result.status == EVENT_BATCH_INVALID for result in results),
+                failed=sum(result.status == EVENT_BATCH_FAILED for result in results),
+                results=results,
+            )
+        ),
+        headers=await _get_bookmarks_headers(event_repository),
+    )
+
+
+async def _get_bookmarks_headers(event_repository: EventRepository) -> Dict[str, str]:
+    # Clients send these back to read their own writes from any cluster member.
+    return {BOOKMARKS_HEADER: ",".join(await event_repository.get_bookmarks())}
+
+
+def _validate_item(index: int, item: Any, titles: Set[str], strings: StringsEN) -> EventCreate | EventBatchItemResult:
+    try:
+        if isinstance(item, bytes):
+            event = EventCreate.model_validate_json(item)
+        else:
+            event = EventCreate.model_validate(item)
+    except ValidationError as exception:
+        message = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in exception.errors())
+        return EventBatchItemResult(index=index, status=EVENT_BATCH_INVALID, message=message)
+
+    if event.title in titles:
+        return EventBatchItemResult(index=index, status=EVENT_BATCH_DUPLICATE, message=strings.EVENT_IS_EXISTS)
+
+    titles.add(event.title)
+
+    return event
+
+
+async def _iterate_items(items: List[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def _create_events_chunk(
+        event_repository: EventRepository,
+        user_id: int,
+        chunk: List[Tuple[int, EventCreate]],
+        strings: StringsEN,
+) -> List[EventBatchItemResult]:
+    try:
+        created_events = await event_repository.create_events_by_user_id(user_id, chunk)
+    except EntityAlreadyExists:
+        # Earlier chunks are already committed, so only this chunk's items are reported as failed.
+        return [
+            EventBatchItemResult(index=index, status=EVENT_BATCH_FAILED, message=strings.EVENT_IS_EXISTS)
+            for index, _ in chunk
+        ]
+    except EntityCreateError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.EVENT_CREATE_ERROR)
+
+    results: List[EventBatchItemResult] = []
+
+    for index, _ in chunk:
+        if index in created_events:
+            results.append(EventBatchItemResult(index=index, status=EVENT_BATCH_CREATED, event_id=created_events[index]))
+        else:
+            results.append(EventBatchItemResult(index=index, status=EVENT_BATCH_DUPLICATE, message=strings.EVENT_IS_EXISTS))
+
+    return results
+
+
 @router.get("", status_code=status.HTTP_200_OK, name="events:get-events-by-filter")
 async def get_events_by_filter(
         events_filter: EventsFilter = Depends(get_events_filter),
+        language: str = Depends(get_language),
+        accept: str | None = Depends(get_accept),
+        if_none_match: str | None = Depends(get_if_none_match),
+        settings: AppSettings = Depends(get_app_settings),
+        pool: SessionPool = Depends(get_session_pool),
+        cache: CacheBackend | None = Depends(get_cache),
+        read_model: EventReadModel | None = Depends(get_read_model),
+        slow_query_log: SlowQueryLog | None = Depends(get_slow_query_log),
+        bookmarks: List[str] = Depends(get_bookmarks),
         event_repository: EventRepository = Depends(get_repository(EventRepository)),
 ) -> WrapperResponse:
-    events = await event_repository.get_events(events_filter.limit, events_filter.offset)
+    strings = strings_factory.get_language(language)
+
+    location_filter = (events_filter.latitude, events_filter.longitude, events_filter.radius_km)
+    is_location_filter = any(value is not None for value in location_filter)
+    if is_location_filter and any(value is None for value in location_filter):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_LOCATION_FILTER)
+
+    starts_after, starts_before = _get_time_window(events_filter, strings)
+
+    after = None
+    if events_filter.cursor and not is_location_filter:
+        after = decode_cursor(events_filter.cursor)
+        if not after:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_CURSOR)
+
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        lines = _stream_events(
+            pool, cache, slow_query_log, bookmarks, events_filter, is_location_filter, after, starts_after, starts_before,
+        )
+
+        # The first line is read before the response starts, so errors such as unknown bookmarks still get a status.
+        first_line = await anext(lines, b"")
 
-    return WrapperResponse(
-        payload=EventsResponse(events=events)
+        return StreamingResponse(_prepend(first_line, lines), media_type=NDJSON_MEDIA_TYPE)
+
+    next_cursor = None
+
+    # The read model lags behind the database, so callers waiting for their own writes skip it.
+    source: EventRepository | EventReadModel = event_repository
+    if read_model is not None and not bookmarks and read_model.covers(starts_after):
+        source = read_model
+
+    if is_location_filter:
+        events = await source.get_events_near(
+            *location_filter,
+            events_filter.limit,
+            events_filter.offset,
+            starts_after=starts_after,
+            starts_before=starts_before,
+        )
+    else:
+        events = await source.get_events(
+            events_filter.limit + 1,
+            events_filter.offset,
+            after,
+            starts_after=starts_after,
+            starts_before=starts_before,
+        )
+
+        if len(events) > events_filter.limit:
+            events = events[:events_filter.limit]
+            next_cursor = encode_cursor(events[-1].start_at, events[-1].id)
+
+    headers = {
+        "ETag": get_events_etag(events, next_cursor),
+        "Cache-Control": settings.events_cache_control,
+    }
+
+    if is_etag_matched(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return WrapperJSONResponse(
+        WrapperResponse(payload=EventsResponse(events=events, next_cursor=next_cursor)),
+        headers=headers,
+    )
+
+
+def _get_time_window(events_filter: EventsFilter, strings: StringsEN) -> Tuple[datetime | None, datetime | None]:
+    starts_after = events_filter.starts_after
+    if starts_after is None and events_filter.upcoming:
+        starts_after = utc_now()
+
+    # Valid ISO bounds near the ends of the calendar overflow when shifted to UTC.
+    try:
+        starts_after = to_utc(starts_after) if starts_after else None
+        starts_before = to_utc(events_filter.starts_before) if events_filter.starts_before else None
+    except OverflowError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_TIME_WINDOW)
+
+    if starts_after and starts_before and starts_after >= starts_before:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_TIME_WINDOW)
+
+    return starts_after, starts_before
+
+
+async def _stream_events(
+        pool: SessionPool,
+        cache: CacheBackend | None,
+        slow_query_log: SlowQueryLog | None,
+        bookmarks: List[str],
+        events_filter: EventsFilter,
+        is_location_filter: bool,
+        after: Tuple[datetime, int] | None,
+        starts_after: datetime | None,
+        starts_before: datetime | None,
+) -> AsyncIterator[bytes]:
+    # The stream outlives the request's dependencies, so it owns its session and reads
+    # the page from an explicit transaction as the response is written.
+    async with pool.session(bookmarks, default_access_mode=READ_ACCESS) as session:
+        event_repository = EventRepository(session, cache, slow_query_log)
+
+        if is_location_filter:
+            events = event_repository.iterate_events_near(
+                events_filter.latitude,
+                events_filter.longitude,
+                events_filter.radius_km,
+                events_filter.limit,
+                events_filter.offset,
+                starts_after=starts_after,
+                starts_before=starts_before,
+                is_stream=True,
+            )
+        else:
+            events = event_repository.iterate_events(
+                events_filter.limit,
+                events_filter.offset,
+                after,
+                starts_after=starts_after,
+                starts_before=starts_before,
+                is_stream=True,
+            )
+
+        async for event in events:
+            yield event.model_dump_json().encode() + b"\n"
+
+
+async def _prepend(first_line: bytes, lines: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first_line
+
+    async for line in lines:
+        yield line
+
+
+@router.get("/search", status_code=status.HTTP_200_OK, name="events:search-events")
+async def search_events(
+        search_filter: EventsSearchFilter = Depends(get_events_search_filter),
+        language: str = Depends(get_language),
+        event_repository: EventRepository = Depends(get_repository(EventRepository)),
+) -> WrapperResponse:
+    strings = strings_factory.get_language(language)
+
+    if not escape_query(search_filter.query):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.WRONG_SEARCH_QUERY)
+
+    results = await event_repository.search_events(
+        search_filter.query,
+        search_filter.language,
+        search_filter.limit,
+        search_filter.offset,
+    )
+
+    return WrapperJSONResponse(
+        WrapperResponse(
+            payload=EventsSearchResponse(
+                results=[EventSearchResult(event=event, score=score) for event, score in results],
+            )
+        )
     )
 
 
@@ -64,6 +377,8 @@ async def get_events_by_filter(
 async def get_event_by_id(
         event_id: int = Depends(get_event_id),
         language: str = Depends(get_language),
+        if_none_match: str | None = Depends(get_if_none_match),
+        settings: AppSettings = Depends(get_app_settings),
         event_repository: EventRepository = Depends(get_repository(EventRepository)),
 ) -> WrapperResponse:
     strings = strings_factory.get_language(language)
@@ -72,8 +387,17 @@ async def get_event_by_id(
     if not event:
         raise HTTPException(status.HTTP_404_NOT_FOUND, strings.EVENT_DOES_NOT_EXIST)
 
-    return WrapperResponse(
-        payload=EventResponse(event=event)
+    headers = {
+        "ETag": get_event_etag(event),
+        "Cache-Control": settings.event_cache_control,
+    }
+
+    if is_etag_matched(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return WrapperJSONResponse(
+        WrapperResponse(payload=EventResponse(event=event)),
+        headers=headers,
     )
 
 
@@ -87,18 +411,18 @@ async def update_event_by_id(
 ) -> WrapperResponse:
     strings = strings_factory.get_language(language)
 
-    if await event_repository.get_event_by_title(request.title):
-        raise HTTPException(status.HTTP_409_CONFLICT, strings.EVENT_IS_EXISTS)
-
-    if not await event_repository.get_event_by_id(event_id):
+    try:
+        event = await event_repository.update_event_by_id(user_id, event_id, **dict(request))
+    except EntityDoesNotExists:
         raise HTTPException(status.HTTP_404_NOT_FOUND, strings.EVENT_DOES_NOT_EXIST)
+    except EntityAccessDenied:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, strings.EVENT_ACCESS_DENIED)
+    except EntityAlreadyExists:
+        raise HTTPException(status.HTTP_409_CONFLICT, strings.EVENT_IS_EXISTS)
 
-    event = await event_repository.update_event_by_id(user_id, event_id, **request.dict())
-    if not event:
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, strings.EVENT_CREATE_ERROR)
-
-    return WrapperResponse(
-        payload=EventResponse(event=event)
+    return WrapperJSONResponse(
+        WrapperResponse(payload=EventResponse(event=event)),
+        headers=await _get_bookmarks_headers(event_repository),
     )
 
 
@@ -111,9 +435,14 @@ async def delete_event_by_id(
 ) -> WrapperResponse:
     strings = strings_factory.get_language(language)
 
-    if not await event_repository.get_event_by_id(event_id):
-        raise HTTPException(status.HTTP_409_CONFLICT, strings.EVENT_DOES_NOT_EXIST)
-
-    await event_repository.delete_event_by_id(user_id, event_id)
+    try:
+        await event_repository.delete_event_by_id(user_id, event_id)
+    except EntityDoesNotExists:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, strings.EVENT_DOES_NOT_EXIST)
+    except EntityAccessDenied:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, strings.EVENT_ACCESS_DENIED)
 
-    return WrapperResponse()
+    return WrapperJSONResponse(
+        WrapperResponse(),
+        headers=await _get_bookmarks_headers(event_repository),
+    )
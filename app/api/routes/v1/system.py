@@ -0,0 +1,83 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.dependencies.authentication import get_token_cache
+from app.api.dependencies.database import get_cache, get_read_model, get_session_pool, get_slow_query_log
+from app.api.dependencies.get_from_header import get_language
+from app.api.dependencies.system import get_is_ready
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.database.pool import SessionPool
+from app.models.schemas.system import ReadinessResponse, SlowQueriesResponse, SystemStatsResponse
+from app.models.schemas.wrapper import WrapperResponse
+from app.resources import strings_factory
+from app.services.cache import CacheBackend
+from app.services.read_model import EventReadModel
+from app.services.slow_query_log import SlowQueryLog
+from app.services.token_cache import TokenCache
+
+router = APIRouter()
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK, name="system:get-readiness")
+async def get_readiness(
+        language: str = Depends(get_language),
+        is_ready: bool = Depends(get_is_ready),
+) -> WrapperResponse:
+    strings = strings_factory.get_language(language)
+
+    if not is_ready:
+        raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, strings.SERVICE_IS_NOT_READY)
+
+    return WrapperResponse(payload=ReadinessResponse(ready=True))
+
+
+@router.get("/stats", status_code=status.HTTP_200_OK, name="system:get-stats")
+async def get_stats(
+        pool: SessionPool = Depends(get_session_pool),
+        token_cache: TokenCache = Depends(get_token_cache),
+        cache: CacheBackend | None = Depends(get_cache),
+        read_model: EventReadModel | None = Depends(get_read_model),
+) -> WrapperResponse:
+    return WrapperResponse(
+        payload=SystemStatsResponse(
+            pool=pool.stats(),
+            token_cache=token_cache.stats(),
+            event_cache=cache.stats() if cache is not None else None,
+            read_model=read_model.stats() if read_model is not None else None,
+        )
+    )
+
+
+@router.get("/slow-queries", status_code=status.HTTP_200_OK, name="system:get-slow-queries")
+async def get_slow_queries(
+        limit: int = Query(10, ge=1),
+        language: str = Depends(get_language),
+        settings: AppSettings = Depends(get_app_settings),
+        slow_query_log: SlowQueryLog | None = Depends(get_slow_query_log),
+) -> WrapperResponse:
+    strings = strings_factory.get_language(language)
+
+    # Query text and plans describe the schema, so they are only exposed when explicitly enabled.
+    if not settings.slow_query_endpoint_enabled:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, strings.SLOW_QUERY_LOG_IS_DISABLED)
+
+    return WrapperResponse(
+        payload=SlowQueriesResponse(
+            enabled=slow_query_log is not None,
+            queries=slow_query_log.get_slowest(limit) if slow_query_log is not None else [],
+        )
+    )
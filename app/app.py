@@ -16,10 +16,18 @@ from fastapi import FastAPI
 from fastapi.exceptions import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.errors.bookmarks_error import bookmarks_error_handler
 from app.api.errors.http_error import http_error_handler
+from app.api.middlewares.access_log import AccessLogMiddleware
+from app.api.middlewares.metrics import MetricsMiddleware
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.v1.api import router as api_router
 from app.core.config import get_app_settings
 from app.core.events import create_start_app_handler, create_stop_app_handler
+from app.database.errors import InvalidBookmarks
+from app.services.cache import create_cache_backend
+from app.services.key_set import KeySet
+from app.services.token_cache import TokenCache
 
 
 def get_application() -> FastAPI:
@@ -27,6 +35,12 @@ def get_application() -> FastAPI:
     settings.configure_logging()
 
     application = FastAPI(**settings.fastapi_kwargs)
+    application.state.key_set = KeySet(settings.public_key_path, settings.jwt_algorithms, settings.jwt_keys_reload_interval)
+    application.state.token_cache = TokenCache(settings.jwt_cache_size)
+    application.state.cache = create_cache_backend(settings)
+    application.state.read_model = None
+    application.state.is_ready = False
+    application.state.slow_query_log = None
 
     application.add_middleware(
         CORSMiddleware,
@@ -47,10 +61,29 @@ def get_application() -> FastAPI:
 
     application.add_exception_handler(HTTPException, http_error_handler)
     application.add_exception_handler(404, http_error_handler)
+    application.add_exception_handler(InvalidBookmarks, bookmarks_error_handler)
 
     application.include_router(api_router, prefix=settings.api_prefix)
 
+    if settings.metrics_enabled:
+        application.add_middleware(MetricsMiddleware)
+        application.include_router(metrics_router)
+
+    if settings.access_log_enabled:
+        application.add_middleware(
+            AccessLogMiddleware,
+            sample_rate=settings.access_log_sample_rate,
+            slow_threshold=settings.access_log_slow_threshold,
+        )
+
     return application
 
 
-app: FastAPI = get_application()
+def __getattr__(name: str) -> FastAPI:
+    # Built on first access, so "python -m app" can import the factory without creating an application.
+    if name == "app":
+        application = get_application()
+        globals()["app"] = application
+        return application
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,18 +18,53 @@ from loguru import logger
 
 from app.core.settings.app import AppSettings
 from app.database.events import close_db_connection, connect_to_db
+from app.database.migrations import apply_migrations
+from app.services.read_model import EventReadModel
+from app.services.slow_query_log import SlowQueryLog
+from app.services.warm_up import warm_up
 
 
 def create_start_app_handler(app: FastAPI, settings: AppSettings) -> Callable:
     async def start_app() -> None:
         await connect_to_db(app, settings)
 
+        if settings.database_migrate_on_startup:
+            migrations = await apply_migrations(app.state.pool)
+            logger.info("Applied {count} schema migration(s)", count=len(migrations))
+
+        if settings.slow_query_log_enabled:
+            app.state.slow_query_log = SlowQueryLog.from_settings(app.state.pool, settings)
+
+        if settings.read_model_enabled:
+            app.state.read_model = EventReadModel.from_settings(app.state.pool, settings)
+            await app.state.read_model.start()
+            logger.info("Event read model loaded {size} event(s)", size=app.state.read_model.stats().size)
+
+        if settings.warm_up_enabled:
+            connections = min(settings.warm_up_connections, settings.database_max_connection_pool_size)
+            await warm_up(app.state.pool, app.state.key_set, connections)
+
+        app.state.is_ready = True
+
     return start_app
 
 
 def create_stop_app_handler(app: FastAPI) -> Callable:
     @logger.catch
     async def stop_app() -> None:
+        app.state.is_ready = False
+
+        if app.state.read_model is not None:
+            await app.state.read_model.close()
+
+        if app.state.slow_query_log is not None:
+            await app.state.slow_query_log.close()
+
         await close_db_connection(app)
 
+        if app.state.cache is not None:
+            await app.state.cache.close()
+
+        await logger.complete()
+
     return stop_app
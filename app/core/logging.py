@@ -20,6 +20,10 @@ from loguru import logger
 
 
 class InterceptHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET, is_caller_enabled: bool = True) -> None:
+        super().__init__(level)
+        self.is_caller_enabled = is_caller_enabled
+
     def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover
         # Get corresponding Loguru level if it exists
         try:
@@ -27,6 +31,10 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = str(record.levelno)
 
+        if not self.is_caller_enabled:
+            logger.opt(exception=record.exc_info).log(level, record.getMessage())
+            return
+
         # Find caller from where originated the logged message
         frame, depth = logging.currentframe(), 2
         while frame.f_code.co_filename == logging.__file__:  # noqa: WPS609
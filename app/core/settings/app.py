@@ -15,9 +15,9 @@
 import logging
 import sys
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Literal, Tuple
 from loguru import logger
-from pydantic import ConfigDict, FilePath
+from pydantic import ConfigDict, FilePath, model_validator
 
 from app.core.logging import InterceptHandler
 from app.core.settings.base import BaseAppSettings
@@ -36,20 +36,87 @@ class AppSettings(BaseAppSettings):
     database_port: int = 7687
     database_user: str = "neo4j"
     database_pass: str
+    database_max_connection_pool_size: int = 100
+    database_connection_acquisition_timeout: float = 60.0
+    database_max_connection_lifetime: float = 3600.0
+    database_max_transaction_retry_time: float = 15.0
+    database_initial_retry_delay: float = 1.0
+    database_retry_delay_multiplier: float = 2.0
+    database_retry_delay_jitter_factor: float = 0.2
+    database_migrate_on_startup: bool = True
+
+    slow_query_log_enabled: bool = False
+    slow_query_threshold: float = 0.5
+    slow_query_profile: bool = False
+    slow_query_profile_interval: float = 300.0
+    slow_query_log_size: int = 50
+    slow_query_endpoint_enabled: bool = False
+
+    server_host: str = "127.0.0.1"
+    server_port: int = 8000
+    server_workers: int = 1
+    server_loop: Literal["auto", "asyncio", "uvloop"] = "uvloop"
+    server_http: Literal["auto", "h11", "httptools"] = "httptools"
+    server_limit_max_requests: int | None = None
+    server_limit_max_requests_jitter: int = 0
+    server_timeout_graceful_shutdown: int | None = 30
 
     public_key_path: FilePath
-    public_key: str = ""
 
     api_prefix: str = "/api"
 
     jwt_token_prefix: str = "Bearer"
+    jwt_cache_size: int = 1024
+    jwt_algorithms: List[str] = ["RS512"]
+    jwt_keys_reload_interval: float = 5.0
 
     allowed_hosts: List[str] = ["*"]
 
+    metrics_enabled: bool = True
+
+    cache_backend: Literal["none", "memory", "redis"] = "memory"
+    cache_url: str = "redis://127.0.0.1:6379/0"
+    cache_ttl: float = 60.0
+    cache_max_size: int = 10000
+
+    event_cache_control: str = "private, no-cache"
+    events_cache_control: str = "private, no-cache"
+    events_batch_chunk_size: int = 500
+
+    warm_up_enabled: bool = True
+    warm_up_connections: int = 10
+
+    read_model_enabled: bool = False
+    read_model_poll_interval: float = 1.0
+    read_model_reconcile_interval: float = 30.0
+    read_model_sync_overlap: float = 5.0
+    read_model_cell_size: float = 0.5
+
     logging_level: int = logging.INFO
+    logging_enqueue: bool = False
+    logging_serialize: bool = False
+    logging_caller: bool = True
+    access_log_enabled: bool = False
+    access_log_sample_rate: float = 1.0
+    access_log_slow_threshold: float = 1.0
     loggers: Tuple[str, str] = ("uvicorn.asgi", "uvicorn.access")
     model_config = ConfigDict(validate_assignment=True)
 
+    @model_validator(mode="after")
+    def check_server_workers(self) -> "AppSettings":
+        if self.server_workers == 1:
+            return self
+
+        # Each worker process has its own memory cache, and writes only invalidate the local one.
+        if self.cache_backend == "memory":
+            raise ValueError("cache_backend 'memory' is per process; use 'redis' or 'none' with server_workers > 1")
+
+        # Each worker also has its own metrics registry, and a scrape would read one random worker's counters.
+        if self.metrics_enabled:
+            raise ValueError("metrics are collected per process; disable metrics_enabled with server_workers > 1")
+
+        return self
+
     @property
     def fastapi_kwargs(self) -> Dict[str, Any]:
         return {
@@ -62,6 +129,33 @@ class AppSettings(BaseAppSettings):
             "version": self.version,
         }
 
+    @property
+    def server_kwargs(self) -> Dict[str, Any]:
+        return {
+            "host": self.server_host,
+            "port": self.server_port,
+            "workers": self.server_workers,
+            "loop": self.server_loop,
+            "http": self.server_http,
+            "proxy_headers": True,
+            "access_log": not self.access_log_enabled,
+            "limit_max_requests": self.server_limit_max_requests,
+            "limit_max_requests_jitter": self.server_limit_max_requests_jitter,
+            "timeout_graceful_shutdown": self.server_timeout_graceful_shutdown,
+        }
+
+    @property
+    def database_driver_kwargs(self) -> Dict[str, Any]:
+        return {
+            "max_connection_pool_size": self.database_max_connection_pool_size,
+            "connection_acquisition_timeout": self.database_connection_acquisition_timeout,
+            "max_connection_lifetime": self.database_max_connection_lifetime,
+            "max_transaction_retry_time": self.database_max_transaction_retry_time,
+            "initial_retry_delay": self.database_initial_retry_delay,
+            "retry_delay_multiplier": self.database_retry_delay_multiplier,
+            "retry_delay_jitter_factor": self.database_retry_delay_jitter_factor,
+        }
+
     @property
     def get_database_url(self) -> str:
         url_string: str = "neo4j://{host}:{port}".format(
@@ -72,9 +166,22 @@ class AppSettings(BaseAppSettings):
         return url_string
 
     def configure_logging(self) -> None:
-        logging.getLogger().handlers = [InterceptHandler()]
+        logging.getLogger().handlers = [InterceptHandler(is_caller_enabled=self.logging_caller)]
         for logger_name in self.loggers:
             logging_logger = logging.getLogger(logger_name)
-            logging_logger.handlers = [InterceptHandler(level=self.logging_level)]
-
-        logger.configure(handlers=[{"sink": sys.stderr, "level": self.logging_level}])
+            logging_logger.handlers = [InterceptHandler(level=self.logging_level, is_caller_enabled=self.logging_caller)]
+
+        # The sampled access log replaces uvicorn's, which logs every request.
+        if self.access_log_enabled:
+            logging.getLogger("uvicorn.access").disabled = True
+
+        logger.configure(
+            handlers=[
+                {
+                    "sink": sys.stderr,
+                    "level": self.logging_level,
+                    "enqueue": self.logging_enqueue,
+                    "serialize": self.logging_serialize,
+                },
+            ],
+        )
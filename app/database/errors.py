@@ -12,6 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+class EntityAccessDenied(Exception):
+    """Raised when entity belongs to another user."""
+
+
 class EntityAlreadyExists(Exception):
     """Raised when entity was not found in database."""
 
@@ -34,3 +38,7 @@ class EntityGetError(Exception):
 
 class EntityUpdateError(Exception):
     """Raised when entity was not found in database."""
+
+
+class InvalidBookmarks(Exception):
+    """Raised when session bookmarks are unknown to the database or were not reached in time."""
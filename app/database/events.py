@@ -14,32 +14,36 @@
 
 from fastapi import FastAPI
 from loguru import logger
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import AsyncGraphDatabase, AsyncDriver
 
 from app.core.settings.app import AppSettings
+from app.database.pool import SessionPool
 
 
-async def connect_to_db(app: FastAPI, settings: AppSettings) -> AsyncDriver:
-    logger.info("Connecting to Neo4j")
-
-    driver: AsyncDriver = AsyncGraphDatabase.driver(
+def create_driver(settings: AppSettings) -> AsyncDriver:
+    return AsyncGraphDatabase.driver(
         settings.get_database_url,
         auth=(
             settings.database_user,
             settings.database_pass
-        )
+        ),
+        **settings.database_driver_kwargs
     )
 
+
+async def connect_to_db(app: FastAPI, settings: AppSettings) -> AsyncDriver:
+    logger.info("Connecting to Neo4j")
+
+    driver: AsyncDriver = create_driver(settings)
+
     logger.info("Check connection...")
     await driver.verify_connectivity()
 
     logger.info("Check auth...")
     await driver.verify_authentication()
 
-    session: AsyncSession = driver.session()
-
     app.state.driver = driver
-    app.state.session = session
+    app.state.pool = SessionPool(driver, settings.database_max_connection_pool_size)
 
     logger.info("Connection established")
 
@@ -50,9 +54,7 @@ async def close_db_connection(app: FastAPI) -> None:
     logger.info("Closing connection to database")
 
     driver: AsyncDriver = app.state.driver
-    session: AsyncSession = app.state.session
 
-    await session.close()
     await driver.close()
 
     logger.info("Connection closed")
@@ -0,0 +1,128 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from loguru import logger
+from typing import List, NamedTuple
+from neo4j import AsyncResult, Record
+
+from app.database.pool import SessionPool
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    statements: List[str]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        description="Event title constraint, event time indexes and location point index",
+        statements=[
+            "CREATE CONSTRAINT event_title_unique IF NOT EXISTS FOR (event:Event) REQUIRE event.title IS UNIQUE",
+            "CREATE RANGE INDEX event_start_at IF NOT EXISTS FOR (event:Event) ON (event.start_at)",
+            "CREATE RANGE INDEX event_updated_at IF NOT EXISTS FOR (event:Event) ON (event.updated_at)",
+            "CREATE POINT INDEX location_point IF NOT EXISTS FOR (location:Location) ON (location.point)",
+        ],
+    ),
+    Migration(
+        version=2,
+        description="Location point backfill from latitude and longitude",
+        statements=[
+            """
+                MATCH (location:Location)
+                WHERE location.point IS NULL AND location.latitude IS NOT NULL AND location.longitude IS NOT NULL
+                CALL {
+                    WITH location
+                    SET location.point = point({latitude: location.latitude, longitude: location.longitude})
+                } IN TRANSACTIONS OF 1000 ROWS
+            """,
+        ],
+    ),
+    Migration(
+        version=3,
+        description="Event full-text indexes with standard, english and russian analyzers",
+        statements=[
+            """
+                CREATE FULLTEXT INDEX event_text IF NOT EXISTS
+                FOR (event:Event) ON EACH [event.title, event.subtitle, event.text]
+            """,
+            """
+                CREATE FULLTEXT INDEX event_text_en IF NOT EXISTS
+                FOR (event:Event) ON EACH [event.title, event.subtitle, event.text]
+                OPTIONS {indexConfig: {`fulltext.analyzer`: 'english'}}
+            """,
+            """
+                CREATE FULLTEXT INDEX event_text_ru IF NOT EXISTS
+                FOR (event:Event) ON EACH [event.title, event.subtitle, event.text]
+                OPTIONS {indexConfig: {`fulltext.analyzer`: 'russian'}}
+            """,
+        ],
+    ),
+    Migration(
+        version=4,
+        description="Event times converted to UTC",
+        statements=[
+            # An offset keeps toString() at "...Z", a named zone would render "...Z[UTC]" which the event mapping rejects.
+            """
+                MATCH (event:Event)
+                CALL {
+                    WITH event
+                    SET event.start_at = datetime({datetime: event.start_at, timezone: '+00:00'})
+                    SET event.created_at = datetime({datetime: event.created_at, timezone: '+00:00'})
+                    SET event.updated_at = datetime({datetime: event.updated_at, timezone: '+00:00'})
+                } IN TRANSACTIONS OF 1000 ROWS
+            """,
+        ],
+    ),
+]
+
+
+async def apply_migrations(pool: SessionPool) -> List[Migration]:
+    applied: List[Migration] = []
+
+    async with pool.session() as session:
+        result: AsyncResult = await session.run(
+            "MATCH (migration:SchemaMigration) RETURN max(migration.version) AS version"
+        )
+        record: Record = await result.single()
+
+        current_version = record["version"] or 0
+        logger.info("Schema version {version}", version=current_version)
+
+        for migration in MIGRATIONS:
+            if migration.version <= current_version:
+                continue
+
+            logger.info("Applying schema migration {version}: {description}", **migration._asdict())
+
+            for statement in migration.statements:
+                result = await session.run(statement)
+                await result.consume()
+
+            result = await session.run(
+                """
+                    MERGE (migration:SchemaMigration {version: $version})
+                    SET migration.description = $description
+                    SET migration.applied_at = datetime()
+                """,
+                version=migration.version,
+                description=migration.description,
+            )
+            await result.consume()
+
+            applied.append(migration)
+
+    return applied
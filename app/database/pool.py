@@ -0,0 +1,70 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable
+from neo4j import AsyncDriver, AsyncSession, Bookmarks
+
+from app.models.schemas.system import PoolStats
+
+
+class SessionPool:
+    def __init__(self, driver: AsyncDriver, max_size: int) -> None:
+        self._driver = driver
+        self._max_size = max_size
+        self._active_sessions = 0
+        self._opened_sessions = 0
+
+    @property
+    def driver(self) -> AsyncDriver:
+        return self._driver
+
+    @asynccontextmanager
+    async def session(self, bookmarks: Iterable[str] = (), **config: Any) -> AsyncIterator[AsyncSession]:
+        bookmarks = list(bookmarks)
+        if bookmarks:
+            config["bookmarks"] = Bookmarks.from_raw_values(bookmarks)
+
+        session: AsyncSession = self._driver.session(**config)
+
+        self._active_sessions += 1
+        self._opened_sessions += 1
+
+        try:
+            yield session
+        finally:
+            self._active_sessions -= 1
+            await session.close()
+
+    def stats(self) -> PoolStats:
+        in_use = 0
+        idle = 0
+
+        # The driver has no public API for pool utilization, so the connection
+        # lists are read directly and missing internals simply report zero.
+        connections = getattr(getattr(self._driver, "_pool", None), "connections", {})
+        for address_connections in list(connections.values()):
+            for connection in list(address_connections):
+                if connection.in_use:
+                    in_use += 1
+                else:
+                    idle += 1
+
+        return PoolStats(
+            max_size=self._max_size,
+            in_use=in_use,
+            idle=idle,
+            active_sessions=self._active_sessions,
+            opened_sessions=self._opened_sessions,
+        )
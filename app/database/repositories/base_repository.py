@@ -12,13 +12,169 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from neo4j import AsyncSession
+import time
+
+from loguru import logger
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Tuple
+from neo4j import AsyncManagedTransaction, AsyncSession, Record, ResultSummary
+from neo4j.exceptions import Neo4jError
+
+from app.database.errors import InvalidBookmarks
+from app.services.cache import CacheBackend
+from app.services.metrics import QUERY_DURATION, QUERY_ERRORS
+from app.services.slow_query_log import SlowQueryLog, get_query_hash
+
+BOOKMARK_ERRORS = {
+    "Neo.ClientError.Transaction.InvalidBookmark",
+    "Neo.ClientError.Transaction.InvalidBookmarkMixture",
+    "Neo.TransientError.Transaction.BookmarkTimeout",
+}
+
+
+class WarmUpQuery(NamedTuple):
+    query: str
+    parameters: Dict[str, Any]
+    is_write: bool = False
+
+
+class BufferedResult:
+    def __init__(self, records: List[Record], summary: ResultSummary) -> None:
+        self._records = records
+        self._summary = summary
+
+    async def single(self) -> Record | None:
+        return self._records[0] if self._records else None
+
+    async def consume(self) -> ResultSummary:
+        return self._summary
+
+    async def __aiter__(self) -> AsyncIterator[Record]:
+        for record in self._records:
+            yield record
+
+
+async def _run_transaction(
+        tx: AsyncManagedTransaction,
+        query: str,
+        parameters: Dict[str, Any],
+) -> Tuple[List[Record], ResultSummary]:
+    result = await tx.run(query, **parameters)
+    records = [record async for record in result]
+
+    return records, await result.consume()
 
 
 class BaseRepository:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+            self,
+            session: AsyncSession,
+            cache: CacheBackend | None = None,
+            slow_query_log: SlowQueryLog | None = None,
+    ) -> None:
         self._session = session
+        self._cache = cache
+        self._slow_query_log = slow_query_log
 
     @property
     def session(self) -> AsyncSession:
         return self._session
+
+    @property
+    def cache(self) -> CacheBackend | None:
+        return self._cache
+
+    async def get_bookmarks(self) -> List[str]:
+        bookmarks = await self.session.last_bookmarks()
+        return sorted(bookmarks.raw_values)
+
+    def get_warm_up_queries(self) -> List[WarmUpQuery]:
+        return []
+
+    async def warm_up(self) -> int:
+        explained = 0
+
+        # EXPLAIN plans without running the query, and the plan is cached for the same text and parameter types.
+        for query in self.get_warm_up_queries():
+            execute = self.session.execute_write if query.is_write else self.session.execute_read
+
+            try:
+                await execute(_run_transaction, f"EXPLAIN {query.query}", query.parameters)
+            except Exception as exception:
+                logger.warning(
+                    "Failed to warm up query {query_hash}: {exception}",
+                    query_hash=get_query_hash(query.query),
+                    exception=exception,
+                )
+                continue
+
+            explained += 1
+
+        return explained
+
+    async def _read(self, operation: str, query: str, **parameters: Any) -> BufferedResult:
+        return await self._execute(self.session.execute_read, operation, query, parameters)
+
+    async def _write(self, operation: str, query: str, **parameters: Any) -> BufferedResult:
+        return await self._execute(self.session.execute_write, operation, query, parameters)
+
+    async def _iterate(self, operation: str, query: str, is_stream: bool, **parameters: Any) -> AsyncIterator[Record]:
+        records = self._stream(operation, query, parameters) if is_stream else await self._read(operation, query, **parameters)
+
+        async for record in records:
+            yield record
+
+    async def _stream(self, operation: str, query: str, parameters: Dict[str, Any]) -> AsyncIterator[Record]:
+        repository = type(self).__name__
+        started_at = time.perf_counter()
+        records = 0
+
+        # An explicit transaction is not retried, so records are handed out as they arrive
+        # instead of being buffered; the session's access mode decides where it is routed.
+        try:
+            async with await self.session.begin_transaction() as tx:
+                result = await tx.run(query, **parameters)
+
+                async for record in result:
+                    records += 1
+                    yield record
+
+                summary = await result.consume()
+        except Exception as error:
+            QUERY_ERRORS.inc(repository, operation)
+            if isinstance(error, Neo4jError) and error.code in BOOKMARK_ERRORS:
+                raise InvalidBookmarks(error.message) from error
+            raise
+        finally:
+            duration = time.perf_counter() - started_at
+            QUERY_DURATION.observe(duration, repository, operation)
+
+        if self._slow_query_log is not None:
+            self._slow_query_log.capture(query, parameters, f"{repository}.{operation}", duration, records, summary)
+
+    async def _execute(
+            self,
+            execute: Callable[..., Awaitable[Tuple[List[Record], ResultSummary]]],
+            operation: str,
+            query: str,
+            parameters: Dict[str, Any],
+    ) -> BufferedResult:
+        repository = type(self).__name__
+        started_at = time.perf_counter()
+
+        # Managed transactions are retried by the driver on transient errors, so the
+        # records are read inside the transaction function and handed back buffered.
+        try:
+            records, summary = await execute(_run_transaction, query, parameters)
+        except Exception as error:
+            QUERY_ERRORS.inc(repository, operation)
+            if isinstance(error, Neo4jError) and error.code in BOOKMARK_ERRORS:
+                raise InvalidBookmarks(error.message) from error
+            raise
+        finally:
+            duration = time.perf_counter() - started_at
+            QUERY_DURATION.observe(duration, repository, operation)
+
+        if self._slow_query_log is not None:
+            self._slow_query_log.capture(query, parameters, f"{repository}.{operation}", duration, len(records), summary)
+
+        return BufferedResult(records, summary)
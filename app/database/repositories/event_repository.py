@@ -12,20 +12,321 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from loguru import logger
-from typing import List
-from neo4j import AsyncResult, Record
+from typing import AsyncIterator, Dict, Iterable, List, Set, Tuple
+from neo4j import Record
 from neo4j.exceptions import ConstraintError
 from pydantic import HttpUrl
 
-from app.database.repositories.base_repository import BaseRepository
+from app.database.errors import EntityAccessDenied, EntityAlreadyExists, EntityCreateError, EntityDoesNotExists
+from app.database.repositories.base_repository import BaseRepository, BufferedResult, WarmUpQuery
 from app.models.domain.event import Event
 from app.models.domain.location import Location
+from app.models.schemas.event import EventCreate
+from app.services.fulltext import FULLTEXT_INDEXES, escape_query
+from app.services.geo import get_bounding_box
+from app.services.utc import to_utc, utc_now
+
+MIN_START_AT = datetime.min.replace(tzinfo=timezone.utc)
+MAX_START_AT = datetime.max.replace(tzinfo=timezone.utc)
+
+EVENT_CACHE_KEY = "event:{event_id}"
+
+CREATE_EVENT_QUERY = """
+    OPTIONAL MATCH (existing:Event {title: $title})
+    WITH count(existing) > 0 AS is_conflict
+    OPTIONAL MATCH (user:User)
+    WHERE id(user) = $user_id
+    FOREACH (author IN CASE WHEN is_conflict OR user IS NULL THEN [] ELSE [user] END |
+        CREATE (event:Event)-[:Author]->(author)
+        CREATE (event)-[:LocatedAt]->(location:Location)
+        SET event.title = $title
+        SET event.subtitle = $subtitle
+        SET event.text = $text
+        SET event.picture = $picture
+        SET event.start_at = $start_at
+        SET event.created_at = $created_at
+        SET event.updated_at = $updated_at
+        SET location.name = $location.name
+        SET location.description = $location.description
+        SET location.address = $location.address
+        SET location.latitude = $location.latitude
+        SET location.longitude = $location.longitude
+        SET location.point = point({latitude: $location.latitude, longitude: $location.longitude})
+    )
+    WITH is_conflict, user IS NOT NULL AS is_author_found
+    OPTIONAL MATCH (event:Event {title: $title})-[:LocatedAt]->(location:Location)
+    WHERE is_author_found AND NOT is_conflict
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row, is_conflict, is_author_found
+"""
+
+CREATE_EVENTS_QUERY = """
+    OPTIONAL MATCH (user:User)
+    WHERE id(user) = $user_id
+    UNWIND $events AS item
+    OPTIONAL MATCH (existing:Event {title: item.title})
+    WITH user, item, existing IS NULL AND user IS NOT NULL AS is_created
+    FOREACH (author IN CASE WHEN is_created THEN [user] ELSE [] END |
+        CREATE (event:Event)-[:Author]->(author)
+        CREATE (event)-[:LocatedAt]->(location:Location)
+        SET event.title = item.title
+        SET event.subtitle = item.subtitle
+        SET event.text = item.text
+        SET event.picture = item.picture
+        SET event.start_at = item.start_at
+        SET event.created_at = $created_at
+        SET event.updated_at = $created_at
+        SET location.name = item.location.name
+        SET location.description = item.location.description
+        SET location.address = item.location.address
+        SET location.latitude = item.location.latitude
+        SET location.longitude = item.location.longitude
+        SET location.point = point({latitude: item.location.latitude, longitude: item.location.longitude})
+    )
+    WITH user, item, is_created
+    OPTIONAL MATCH (event:Event {title: item.title})
+    WHERE is_created
+    RETURN item.index AS index, id(event) AS event_id, user IS NOT NULL AS is_author_found
+"""
+
+GET_EVENTS_QUERY = """
+    MATCH (event:Event)-[:LocatedAt]->(location:Location)
+    WHERE event.start_at >= $after_start_at
+      AND event.start_at < $before_start_at
+      AND (event.start_at > $after_start_at OR id(event) > $after_id)
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row
+    ORDER BY event.start_at, id(event)
+    SKIP $offset
+    LIMIT $limit
+"""
+
+GET_EVENTS_UPDATED_AFTER_QUERY = """
+    MATCH (event:Event)-[:LocatedAt]->(location:Location)
+    WHERE event.updated_at >= $updated_after AND event.start_at >= $starts_after
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row
+    ORDER BY event.updated_at
+"""
+
+GET_EVENT_IDS_QUERY = """
+    MATCH (event:Event)
+    WHERE event.start_at >= $starts_after
+    RETURN id(event) AS event_id
+"""
+
+GET_EVENTS_BY_IDS_QUERY = """
+    MATCH (event:Event)-[:LocatedAt]->(location:Location)
+    WHERE id(event) IN $event_ids
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row
+"""
+
+GET_EVENTS_NEAR_QUERY = """
+    MATCH (location:Location)
+    WHERE point.withinBBox(
+        location.point,
+        point({latitude: $south, longitude: $west}),
+        point({latitude: $north, longitude: $east})
+    )
+    WITH location, point.distance(location.point, point({latitude: $latitude, longitude: $longitude})) AS distance
+    WHERE distance <= $radius
+    MATCH (event:Event)-[:LocatedAt]->(location)
+    WHERE event.start_at >= $starts_after AND event.start_at < $starts_before
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row
+    ORDER BY distance, id(event)
+    SKIP $offset
+    LIMIT $limit
+"""
+
+SEARCH_EVENTS_QUERY = """
+    CALL db.index.fulltext.queryNodes($index, $text) YIELD node AS event, score
+    MATCH (event)-[:LocatedAt]->(location:Location)
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row, score
+    ORDER BY score DESC, id(event)
+    SKIP $offset
+    LIMIT $limit
+"""
+
+GET_EVENT_BY_ID_QUERY = """
+    MATCH (event:Event)-[:LocatedAt]->(location:Location)
+    WHERE id(event) = $event_id
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row
+"""
+
+GET_EVENT_BY_TITLE_QUERY = """
+    MATCH (event:Event {title: $title})-[:LocatedAt]->(location:Location)
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row
+"""
+
+UPDATE_EVENT_QUERY = """
+    MATCH (event:Event)-[:LocatedAt]->(location:Location)
+    WHERE id(event) = $event_id
+    OPTIONAL MATCH (event)-[:Author]->(author:User)
+    WHERE id(author) = $user_id
+    OPTIONAL MATCH (other:Event {title: $title})
+    WHERE other <> event
+    WITH event, location, author IS NOT NULL AS is_owner, count(other) > 0 AS is_conflict
+    FOREACH (_ IN CASE WHEN is_owner AND NOT is_conflict THEN [1] ELSE [] END |
+        SET event.title = coalesce($title, event.title)
+        SET event.subtitle = coalesce($subtitle, event.subtitle)
+        SET event.text = coalesce($text, event.text)
+        SET event.picture = coalesce($picture, event.picture)
+        SET event.start_at = coalesce($start_at, event.start_at)
+        SET event.updated_at = $updated_at
+        SET location.name = coalesce($location.name, location.name)
+        SET location.description = coalesce($location.description, location.description)
+        SET location.address = coalesce($location.address, location.address)
+        SET location.latitude = coalesce($location.latitude, location.latitude)
+        SET location.longitude = coalesce($location.longitude, location.longitude)
+        SET location.point = point({latitude: location.latitude, longitude: location.longitude})
+    )
+    RETURN event {
+        id: id(event),
+        .title,
+        .subtitle,
+        .text,
+        .picture,
+        start_at: toString(event.start_at),
+        created_at: toString(event.created_at),
+        updated_at: toString(event.updated_at),
+        location: location {.name, .description, .address, .latitude, .longitude}
+    } AS row, is_owner, is_conflict
+"""
+
+DELETE_EVENT_QUERY = """
+    MATCH (event:Event)
+    WHERE id(event) = $event_id
+    OPTIONAL MATCH (event)-[:Author]->(author:User)
+    WHERE id(author) = $user_id
+    OPTIONAL MATCH (event)-[:LocatedAt]->(location:Location)
+    WITH event, location, author IS NOT NULL AS is_owner
+    FOREACH (_ IN CASE WHEN is_owner THEN [1] ELSE [] END |
+        DETACH DELETE event, location
+    )
+    RETURN is_owner
+"""
 
 
 class EventRepository(BaseRepository):
 
+    def get_warm_up_queries(self) -> List[WarmUpQuery]:
+        now = utc_now()
+        location = Location(name="", latitude=0.0, longitude=0.0).model_dump()
+        event = {"title": "", "subtitle": "", "text": "", "picture": "", "location": location, "start_at": now}
+
+        return [
+            WarmUpQuery(CREATE_EVENT_QUERY, {"user_id": 0, "created_at": now, "updated_at": now, **event}, True),
+            WarmUpQuery(CREATE_EVENTS_QUERY, {"user_id": 0, "events": [{"index": 0, **event}], "created_at": now}, True),
+            WarmUpQuery(
+                GET_EVENTS_QUERY,
+                {"limit": 1, "offset": 0, "after_start_at": MIN_START_AT, "after_id": -1, "before_start_at": MAX_START_AT},
+            ),
+            WarmUpQuery(GET_EVENTS_UPDATED_AFTER_QUERY, {"updated_after": now, "starts_after": now}),
+            WarmUpQuery(GET_EVENT_IDS_QUERY, {"starts_after": now}),
+            WarmUpQuery(GET_EVENTS_BY_IDS_QUERY, {"event_ids": [0]}),
+            WarmUpQuery(
+                GET_EVENTS_NEAR_QUERY,
+                {
+                    "latitude": 0.0,
+                    "longitude": 0.0,
+                    "radius": 1000.0,
+                    "limit": 1,
+                    "offset": 0,
+                    "starts_after": MIN_START_AT,
+                    "starts_before": MAX_START_AT,
+                    **get_bounding_box(0.0, 0.0, 1.0)._asdict(),
+                },
+            ),
+            WarmUpQuery(SEARCH_EVENTS_QUERY, {"index": FULLTEXT_INDEXES[None], "text": "ride", "limit": 1, "offset": 0}),
+            WarmUpQuery(GET_EVENT_BY_ID_QUERY, {"event_id": 0}),
+            WarmUpQuery(GET_EVENT_BY_TITLE_QUERY, {"title": ""}),
+            WarmUpQuery(
+                UPDATE_EVENT_QUERY,
+                {"user_id": 0, "event_id": 0, "updated_at": now, **dict.fromkeys(event)},
+                True,
+            ),
+            WarmUpQuery(DELETE_EVENT_QUERY, {"user_id": 0, "event_id": 0}, True),
+        ]
+
     async def create_event_by_user_id(
             self,
             user_id: int,
@@ -33,84 +334,242 @@ class EventRepository(BaseRepository):
             title: str,
             subtitle: str = "",
             text: str,
-            picture: HttpUrl,
+            picture: HttpUrl | str,
             location: Location,
             start_at: datetime,
             **kwargs
-    ) -> Event | None:
-        query = """
-            MATCH (user:User)
-            WHERE id(user) = $user_id
-            CREATE (event:Event)-[:Author]->(user)
-            CREATE (event)-[:LocatedAt]->(location:Location)
-            SET event.title = $title
-            SET event.subtitle = $subtitle
-            SET event.text = $text
-            SET event.picture = $picture
-            SET event.start_at = $start_at
-            SET event.created_at = $created_at
-            SET event.updated_at = $updated_at
-            SET location.name = $location.name
-            SET location.description = $location.description
-            SET location.address = $location.address
-            SET location.latitude = $location.latitude
-            SET location.longitude = $location.longitude
-            RETURN id(event) AS event_id, event, location
-        """
-
-        event = Event(title=title, subtitle=subtitle, text=text, picture=picture, location=location, start_at=start_at)
-
-        tz = timezone(offset=timedelta(hours=3))
-
-        event.created_at = datetime.now(tz)
-        event.updated_at = datetime.now(tz)
-
-        result: AsyncResult = await self.session.run(query, user_id=user_id, **event.dict())
+    ) -> Event:
+        created_at = utc_now()
 
         try:
-            record: Record | None = await result.single()
+            result: BufferedResult = await self._write(
+                "create_event_by_user_id",
+                CREATE_EVENT_QUERY,
+                user_id=user_id,
+                title=title,
+                subtitle=subtitle,
+                text=text,
+                picture=str(picture),
+                location=location.model_dump(),
+                start_at=to_utc(start_at),
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            record: Record = await result.single()
         except ConstraintError as exception:
             logger.warning(exception)
-            return None
+            raise EntityAlreadyExists from exception
+
+        if record["is_conflict"]:
+            raise EntityAlreadyExists
+
+        if not record["is_author_found"]:
+            raise EntityCreateError
 
         return self.get_event_from_record(record)
 
-    async def get_events(self, limit: int, offset: int) -> List[Event]:
-        query = """
-            MATCH (event:Event)-[:LocatedAt]->(location:Location)
-            RETURN id(event) AS event_id, event, location
-            LIMIT $limit
-        """
+    async def create_events_by_user_id(self, user_id: int, events: List[Tuple[int, EventCreate]]) -> Dict[int, int]:
+        items = [
+            {
+                "index": index,
+                "title": event.title,
+                "subtitle": event.subtitle,
+                "text": event.text,
+                "picture": str(event.picture),
+                "location": event.location.model_dump(),
+                "start_at": to_utc(event.start_at),
+            }
+            for index, event in events
+        ]
+
+        # A concurrent create of the same title fails the whole chunk on the uniqueness constraint.
+        # Once that event is committed a retry reports it as a duplicate instead.
+        for attempt in range(2):
+            try:
+                result: BufferedResult = await self._write(
+                    "create_events_by_user_id",
+                    CREATE_EVENTS_QUERY,
+                    user_id=user_id,
+                    events=items,
+                    created_at=utc_now(),
+                )
+                records: List[Record] = [record async for record in result]
+                break
+            except ConstraintError as exception:
+                logger.warning(exception)
+                if attempt:
+                    raise EntityAlreadyExists from exception
+
+        created_events: Dict[int, int] = {}
+
+        for record in records:
+            if not record["is_author_found"]:
+                raise EntityCreateError
+
+            if record["event_id"] is not None:
+                created_events[record["index"]] = record["event_id"]
+
+        return created_events
+
+    async def get_events(
+            self,
+            limit: int,
+            offset: int,
+            after: Tuple[datetime, int] | None = None,
+            *,
+            starts_after: datetime | None = None,
+            starts_before: datetime | None = None,
+    ) -> List[Event]:
+        events = self.iterate_events(limit, offset, after, starts_after=starts_after, starts_before=starts_before)
+        return [event async for event in events]
+
+    async def iterate_events(
+            self,
+            limit: int,
+            offset: int,
+            after: Tuple[datetime, int] | None = None,
+            *,
+            starts_after: datetime | None = None,
+            starts_before: datetime | None = None,
+            is_stream: bool = False,
+    ) -> AsyncIterator[Event]:
+        after_start_at, after_id = after or (MIN_START_AT, -1)
+
+        # The window's lower bound and the cursor share one predicate, whichever is later.
+        if starts_after and starts_after > after_start_at:
+            after_start_at, after_id = starts_after, -1
+
+        records = self._iterate(
+            "get_events",
+            GET_EVENTS_QUERY,
+            is_stream,
+            limit=limit,
+            offset=offset,
+            after_start_at=to_utc(after_start_at),
+            after_id=after_id,
+            before_start_at=to_utc(starts_before) if starts_before else MAX_START_AT,
+        )
 
-        result: AsyncResult = await self.session.run(query, limit=limit)
+        async for record in records:
+            yield self.get_event_from_record(record)
 
-        events: List[Event] = []
+    async def iterate_events_updated_after(self, updated_after: datetime, starts_after: datetime) -> AsyncIterator[Event]:
+        result: BufferedResult = await self._read(
+            "iterate_events_updated_after",
+            GET_EVENTS_UPDATED_AFTER_QUERY,
+            updated_after=to_utc(updated_after),
+            starts_after=to_utc(starts_after),
+        )
 
         async for record in result:
-            event = self.get_event_from_record(record)
-            events.append(event)
+            yield self.get_event_from_record(record)
 
-        return events
+    async def get_event_ids(self, starts_after: datetime) -> Set[int]:
+        result: BufferedResult = await self._read("get_event_ids", GET_EVENT_IDS_QUERY, starts_after=to_utc(starts_after))
+
+        return {record["event_id"] async for record in result}
+
+    async def iterate_events_by_ids(self, event_ids: Iterable[int]) -> AsyncIterator[Event]:
+        result: BufferedResult = await self._read("iterate_events_by_ids", GET_EVENTS_BY_IDS_QUERY, event_ids=list(event_ids))
+
+        async for record in result:
+            yield self.get_event_from_record(record)
+
+    async def get_events_near(
+            self,
+            latitude: float,
+            longitude: float,
+            radius_km: float,
+            limit: int,
+            offset: int,
+            *,
+            starts_after: datetime | None = None,
+            starts_before: datetime | None = None,
+    ) -> List[Event]:
+        events = self.iterate_events_near(
+            latitude,
+            longitude,
+            radius_km,
+            limit,
+            offset,
+            starts_after=starts_after,
+            starts_before=starts_before,
+        )
+        return [event async for event in events]
+
+    async def iterate_events_near(
+            self,
+            latitude: float,
+            longitude: float,
+            radius_km: float,
+            limit: int,
+            offset: int,
+            *,
+            starts_after: datetime | None = None,
+            starts_before: datetime | None = None,
+            is_stream: bool = False,
+    ) -> AsyncIterator[Event]:
+        bounding_box = get_bounding_box(latitude, longitude, radius_km)
+
+        records = self._iterate(
+            "get_events_near",
+            GET_EVENTS_NEAR_QUERY,
+            is_stream,
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius_km * 1000,
+            limit=limit,
+            offset=offset,
+            starts_after=to_utc(starts_after) if starts_after else MIN_START_AT,
+            starts_before=to_utc(starts_before) if starts_before else MAX_START_AT,
+            **bounding_box._asdict(),
+        )
+
+        async for record in records:
+            yield self.get_event_from_record(record)
+
+    async def search_events(
+            self,
+            text: str,
+            language: str | None,
+            limit: int,
+            offset: int,
+    ) -> List[Tuple[Event, float]]:
+        result: BufferedResult = await self._read(
+            "search_events",
+            SEARCH_EVENTS_QUERY,
+            index=FULLTEXT_INDEXES[language],
+            text=escape_query(text),
+            limit=limit,
+            offset=offset,
+        )
+
+        return [(self.get_event_from_record(record), record["score"]) async for record in result]
 
     async def get_event_by_id(self, event_id: int) -> Event | None:
-        query = """
-            MATCH (event:Event)-[:LocatedAt]->(location:Location)
-            WHERE id(event) = $event_id
-            RETURN id(event) AS event_id, event, location
-        """
+        if self.cache is None:
+            return await self._get_event_by_id(event_id)
+
+        key = EVENT_CACHE_KEY.format(event_id=event_id)
 
-        result: AsyncResult = await self.session.run(query, event_id=event_id)
+        cached_event = await self.cache.get(key)
+        if cached_event is not None:
+            return Event.model_validate_json(cached_event)
+
+        event = await self._get_event_by_id(event_id)
+        if event:
+            await self.cache.set(key, event.model_dump_json().encode())
+
+        return event
+
+    async def _get_event_by_id(self, event_id: int) -> Event | None:
+        result: BufferedResult = await self._read("get_event_by_id", GET_EVENT_BY_ID_QUERY, event_id=event_id)
         record: Record | None = await result.single()
 
         return self.get_event_from_record(record)
 
     async def get_event_by_title(self, title: str) -> Event | None:
-        query = """
-            MATCH (event:Event {title: $title})-[:LocatedAt]->(location:Location)
-            RETURN id(event) AS event_id, event, location
-        """
-
-        result: AsyncResult = await self.session.run(query, title=title)
+        result: BufferedResult = await self._read("get_event_by_title", GET_EVENT_BY_TITLE_QUERY, title=title)
         record: Record | None = await result.single()
 
         return self.get_event_from_record(record)
@@ -123,78 +582,70 @@ class EventRepository(BaseRepository):
             title: str | None = None,
             subtitle: str | None = None,
             text: str | None = None,
-            picture: str | None = None,
+            picture: HttpUrl | str | None = None,
             location: Location | None = None,
-            start_at: str | None = None,
+            start_at: datetime | None = None,
             **kwargs
-    ) -> Event | None:
-        event = await self.get_event_by_id(event_id)
-        if not event:
-            return event
-
-        event.title = title or event.title
-        event.subtitle = subtitle or event.subtitle
-        event.text = text or event.text
-        event.picture = picture or event.picture
-        event.location = location or event.location
-        event.start_at = start_at or event.start_at
-
-        tz = timezone(offset=timedelta(hours=3))
-
-        event.updated_at = datetime.now(tz)
-
-        query = """
-            MATCH (location:Location)<-[:LocatedAt]-(event:Event)-[:Author]->(user:User)
-            WHERE id(event) = $event_id AND id(user) = $user_id
-            SET event.title = $title
-            SET event.subtitle = $subtitle
-            SET event.text = $text
-            SET event.picture = $picture
-            SET event.start_at = $start_at
-            SET event.created_at = $created_at
-            SET event.updated_at = $updated_at
-            SET location.name = $location.name
-            SET location.description = $location.description
-            SET location.address = $location.address
-            SET location.latitude = $location.latitude
-            SET location.longitude = $location.longitude
-            RETURN id(event) AS event_id, event, location
-        """
-        await self.session.run(query, user_id=user_id, event_id=event_id, **event.dict())
-
-        return await self.get_event_by_id(event_id)
-
-    async def delete_event_by_id(self, user_id: int, event_id: int) -> None:
-        query = """
-            MATCH (event:Event)-[:Author]->(user:User)
-            WHERE id(event) = $event_id AND id(user) = $user_id
-            DETACH DELETE event
-        """
-        await self.session.run(query, user_id=user_id, event_id=event_id)
+    ) -> Event:
+        try:
+            result: BufferedResult = await self._write(
+                "update_event_by_id",
+                UPDATE_EVENT_QUERY,
+                user_id=user_id,
+                event_id=event_id,
+                title=title or None,
+                subtitle=subtitle or None,
+                text=text or None,
+                picture=str(picture) if picture else None,
+                location=location.model_dump() if location else None,
+                start_at=to_utc(start_at) if start_at else None,
+                updated_at=utc_now(),
+            )
+            record: Record | None = await result.single()
+        except ConstraintError as exception:
+            logger.warning(exception)
+            raise EntityAlreadyExists from exception
 
-    @staticmethod
-    def get_event_from_record(record: Record) -> Event | None:
         if not record:
-            return None
+            raise EntityDoesNotExists
 
-        location = Location(
-            name=record["location"]["name"],
-            description=record["location"]["description"],
-            address=record["location"]["address"],
-            latitude=record["location"]["latitude"],
-            longitude=record["location"]["longitude"],
-        )
+        if not record["is_owner"]:
+            raise EntityAccessDenied
+
+        if record["is_conflict"]:
+            raise EntityAlreadyExists
+
+        await self._invalidate_event(event_id)
 
-        event = Event(
-            id=record["event_id"],
-            title=record["event"]["title"],
-            subtitle=record["event"]["subtitle"],
-            text=record["event"]["text"],
-            picture=record["event"]["picture"],
-            location=location,
-            start_at=datetime.fromisoformat(str(record["event"]["start_at"])),
-            created_at=datetime.fromisoformat(str(record["event"]["created_at"])),
-            updated_at=datetime.fromisoformat(str(record["event"]["updated_at"])),
+        return self.get_event_from_record(record)
+
+    async def delete_event_by_id(self, user_id: int, event_id: int) -> int:
+        result: BufferedResult = await self._write(
+            "delete_event_by_id",
+            DELETE_EVENT_QUERY,
+            user_id=user_id,
+            event_id=event_id,
         )
+        record: Record | None = await result.single()
+        summary = await result.consume()
 
-        return event
+        if not record:
+            raise EntityDoesNotExists
+
+        if not record["is_owner"]:
+            raise EntityAccessDenied
+
+        await self._invalidate_event(event_id)
+
+        return summary.counters.nodes_deleted
+
+    async def _invalidate_event(self, event_id: int) -> None:
+        if self.cache is not None:
+            await self.cache.delete(EVENT_CACHE_KEY.format(event_id=event_id))
+
+    @staticmethod
+    def get_event_from_record(record: Record) -> Event | None:
+        if not record:
+            return None
+
+        return Event.model_validate(record["row"])
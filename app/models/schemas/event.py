@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 from datetime import datetime
-from typing import List
+from typing import List, Literal
 from pydantic import Field, HttpUrl
 
 from app.models.common import BaseAppModel
@@ -23,10 +23,29 @@ from app.models.domain.location import Location
 DEFAULT_EVENTS_LIMIT = 100
 DEFAULT_EVENTS_OFFSET = 0
 
+EVENT_BATCH_CREATED = "created"
+EVENT_BATCH_DUPLICATE = "duplicate"
+EVENT_BATCH_INVALID = "invalid"
+EVENT_BATCH_FAILED = "failed"
+
 
 class EventsFilter(BaseAppModel):
     limit: int = Field(DEFAULT_EVENTS_LIMIT, ge=1)
     offset: int = Field(DEFAULT_EVENTS_OFFSET, ge=0)
+    cursor: str | None = None
+    latitude: float | None = Field(None, ge=-90, le=90)
+    longitude: float | None = Field(None, ge=-180, le=180)
+    radius_km: float | None = Field(None, gt=0)
+    starts_after: datetime | None = None
+    starts_before: datetime | None = None
+    upcoming: bool = True
+
+
+class EventsSearchFilter(BaseAppModel):
+    query: str = Field(min_length=1)
+    language: Literal["en", "ru"] | None = None
+    limit: int = Field(DEFAULT_EVENTS_LIMIT, ge=1)
+    offset: int = Field(DEFAULT_EVENTS_OFFSET, ge=0)
 
 
 class EventResponse(BaseAppModel):
@@ -35,6 +54,16 @@ class EventResponse(BaseAppModel):
 
 class EventsResponse(BaseAppModel):
     events: List[Event]
+    next_cursor: str | None = None
+
+
+class EventSearchResult(BaseAppModel):
+    event: Event
+    score: float
+
+
+class EventsSearchResponse(BaseAppModel):
+    results: List[EventSearchResult]
 
 
 class EventCreate(BaseAppModel):
@@ -53,3 +82,18 @@ class EventUpdate(BaseAppModel):
     picture: HttpUrl | None = None
     location: Location | None = None
     start_at: datetime | None = None
+
+
+class EventBatchItemResult(BaseAppModel):
+    index: int
+    status: Literal["created", "duplicate", "invalid", "failed"]
+    event_id: int | None = None
+    message: str = ""
+
+
+class EventsBatchResponse(BaseAppModel):
+    created: int
+    duplicates: int
+    invalid: int
+    failed: int = 0
+    results: List[EventBatchItemResult]
@@ -0,0 +1,73 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.models.common import BaseAppModel
+
+
+class PoolStats(BaseAppModel):
+    max_size: int
+    in_use: int
+    idle: int
+    active_sessions: int
+    opened_sessions: int
+
+
+class CacheStats(BaseAppModel):
+    size: int | None = None
+    max_size: int | None = None
+    hits: int
+    misses: int
+
+
+class ReadModelStats(BaseAppModel):
+    size: int
+    starts_after: datetime | None = None
+    synced_at: datetime | None = None
+    sync_age_seconds: float | None = None
+    change_lag_seconds: float | None = None
+    syncs: int
+    sync_errors: int
+
+
+class SlowQuery(BaseAppModel):
+    query_hash: str
+    source: str
+    query: str
+    parameters: Dict[str, Any]
+    duration_ms: float
+    available_after_ms: int | None = None
+    consumed_after_ms: int | None = None
+    records: int
+    db_hits: int | None = None
+    plan: List[str] | None = None
+    recorded_at: datetime
+
+
+class SlowQueriesResponse(BaseAppModel):
+    enabled: bool
+    queries: List[SlowQuery]
+
+
+class ReadinessResponse(BaseAppModel):
+    ready: bool
+
+
+class SystemStatsResponse(BaseAppModel):
+    pool: PoolStats
+    token_cache: CacheStats
+    event_cache: CacheStats | None = None
+    read_model: ReadModelStats | None = None
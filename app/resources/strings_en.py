@@ -43,3 +43,14 @@ class StringsEN(object):
     EVENT_DOES_NOT_EXIST = "Event does not exist"
     EVENT_CREATE_ERROR = "Event create is error"
     EVENT_UPDATE_ERROR = "Event update is error"
+    EVENT_ACCESS_DENIED = "Event belongs to another user"
+    WRONG_EVENTS_BATCH = "Events batch must be a JSON array or NDJSON"
+
+    WRONG_CURSOR = "Wrong pagination cursor"
+    WRONG_LOCATION_FILTER = "Location filter requires lat, lon and radius_km"
+    WRONG_TIME_WINDOW = "starts_after must be earlier than starts_before"
+    WRONG_SEARCH_QUERY = "Search query must contain text"
+    WRONG_BOOKMARKS = "X-Bookmarks header holds unknown or unreachable bookmarks"
+
+    SERVICE_IS_NOT_READY = "Service is not ready"
+    SLOW_QUERY_LOG_IS_DISABLED = "Slow query log endpoint is disabled"
@@ -12,12 +12,49 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import lru_cache
+from typing import Dict
+
 from .strings_en import StringsEN
 from .strings_ru import StringsRU
 
+DEFAULT_LANGUAGE = "en"
+
+STRINGS: Dict[str, StringsEN] = {
+    "en": StringsEN(),
+    "ru": StringsRU(),
+}
+
+
+def _get_quality(parameters: str) -> float:
+    for parameter in parameters.split(";"):
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+
+    return 1.0
 
-def get_language(language: str) -> StringsEN:
-    if language == "ru":
-        return StringsRU()
 
-    return StringsEN()
+@lru_cache(maxsize=256)
+def negotiate_language(accept_language: str) -> str:
+    language, quality = DEFAULT_LANGUAGE, 0.0
+
+    for item in accept_language.split(","):
+        tag, _, parameters = item.partition(";")
+        candidate = tag.strip().split("-", 1)[0].lower()
+        if candidate not in STRINGS:
+            continue
+
+        # The first of equally preferred languages wins, a zero quality means "not acceptable".
+        candidate_quality = _get_quality(parameters)
+        if candidate_quality > quality:
+            language, quality = candidate, candidate_quality
+
+    return language
+
+
+def get_language(language: str) -> StringsEN:
+    return STRINGS[negotiate_language(language)]
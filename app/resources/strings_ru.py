@@ -45,3 +45,14 @@ class StringsRU(StringsEN):
     EVENT_DOES_NOT_EXIST = "Событие не найдено"
     EVENT_CREATE_ERROR = "Ошибка создания нового события"
     EVENT_UPDATE_ERROR = "Ошибка обновления события"
+    EVENT_ACCESS_DENIED = "Событие принадлежит другому пользователю"
+    WRONG_EVENTS_BATCH = "Пакет событий должен быть JSON массивом или NDJSON"
+
+    WRONG_CURSOR = "Неверный курсор пагинации"
+    WRONG_LOCATION_FILTER = "Для фильтра по местоположению нужны lat, lon и radius_km"
+    WRONG_TIME_WINDOW = "starts_after должен быть раньше starts_before"
+    WRONG_SEARCH_QUERY = "Поисковый запрос должен содержать текст"
+    WRONG_BOOKMARKS = "Заголовок X-Bookmarks содержит неизвестные или недостижимые закладки"
+
+    SERVICE_IS_NOT_READY = "Сервис ещё не готов"
+    SLOW_QUERY_LOG_IS_DISABLED = "Журнал медленных запросов отключён"
@@ -0,0 +1,129 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import time
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from app.core.settings.app import AppSettings
+from app.models.schemas.system import CacheStats
+
+
+class CacheBackend(ABC):
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses)
+
+    def _count(self, value: bytes | None) -> bytes | None:
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+
+        return value
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, ttl: float, max_size: int) -> None:
+        super().__init__(ttl)
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+
+            return self._count(None)
+
+        self._entries.move_to_end(key)
+
+        return self._count(entry[0])
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        if self._max_size <= 0:
+            return
+
+        self._entries[key] = (value, time.monotonic() + (ttl or self._ttl))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(size=len(self._entries), max_size=self._max_size, hits=self._hits, misses=self._misses)
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, ttl: float, client: Any) -> None:
+        super().__init__(ttl)
+        self._client = client
+
+    @classmethod
+    def from_url(cls, ttl: float, url: str) -> "RedisCacheBackend":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exception:
+            raise RuntimeError("The redis cache backend requires the redis package") from exception
+
+        return cls(ttl, Redis.from_url(url))
+
+    async def get(self, key: str) -> bytes | None:
+        return self._count(await self._client.get(key))
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        await self._client.set(key, value, px=int((ttl or self._ttl) * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def close(self) -> None:
+        await self._client.close()
+
+
+def create_cache_backend(settings: AppSettings) -> CacheBackend | None:
+    if settings.cache_backend == "memory":
+        return MemoryCacheBackend(settings.cache_ttl, settings.cache_max_size)
+
+    if settings.cache_backend == "redis":
+        return RedisCacheBackend.from_url(settings.cache_ttl, settings.cache_url)
+
+    return None
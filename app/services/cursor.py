@@ -0,0 +1,53 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import base64
+import json
+
+from datetime import datetime
+from typing import Tuple
+
+from app.services.utc import to_utc
+
+MIN_EVENT_ID = -2 ** 63
+MAX_EVENT_ID = 2 ** 63 - 1
+
+
+def encode_cursor(start_at: datetime, event_id: int) -> str:
+    data = json.dumps([start_at.isoformat(), event_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int] | None:
+    padding = "=" * (-len(cursor) % 4)
+
+    try:
+        start_at, event_id = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        start_at = datetime.fromisoformat(start_at)
+        event_id = int(event_id)
+
+        if start_at.tzinfo is None:
+            return None
+
+        # Offsets near the ends of the calendar overflow when shifted to UTC.
+        start_at = to_utc(start_at)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+    # Neo4j integers are 64-bit, the driver cannot send anything wider.
+    if not MIN_EVENT_ID <= event_id <= MAX_EVENT_ID:
+        return None
+
+    return start_at, event_id
@@ -0,0 +1,54 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import hashlib
+
+from typing import List
+
+from app.models.domain.event import Event
+
+
+def _get_version(event: Event) -> str:
+    updated_at = event.updated_at.isoformat() if event.updated_at else ""
+    return f"{event.id}:{updated_at}"
+
+
+def get_event_etag(event: Event) -> str:
+    digest = hashlib.sha256(_get_version(event).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def get_events_etag(events: List[Event], next_cursor: str | None = None) -> str:
+    digest = hashlib.sha256()
+
+    for event in events:
+        digest.update(_get_version(event).encode())
+        digest.update(b"\n")
+
+    digest.update((next_cursor or "").encode())
+
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def is_etag_matched(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+
+    return False
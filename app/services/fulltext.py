@@ -0,0 +1,32 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import re
+
+from typing import Dict
+
+FULLTEXT_INDEXES: Dict[str | None, str] = {
+    None: "event_text",
+    "en": "event_text_en",
+    "ru": "event_text_ru",
+}
+
+LUCENE_SPECIAL_CHARACTERS = re.compile(r'([+\-!(){}\[\]^"~*?:\\/|&])')
+LUCENE_OPERATORS = re.compile(r"\b(AND|OR|NOT)\b")
+
+
+def escape_query(query: str) -> str:
+    query = LUCENE_SPECIAL_CHARACTERS.sub(r"\\\1", query.strip())
+    return LUCENE_OPERATORS.sub(lambda match: match.group(1).lower(), query)
@@ -0,0 +1,63 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import math
+
+from typing import NamedTuple
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class BoundingBox(NamedTuple):
+    south: float
+    west: float
+    north: float
+    east: float
+
+
+def get_bounding_box(latitude: float, longitude: float, radius_km: float) -> BoundingBox:
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    delta_latitude = math.degrees(angular_radius)
+
+    south = latitude - delta_latitude
+    north = latitude + delta_latitude
+
+    if south <= -90.0 or north >= 90.0:
+        return BoundingBox(south=max(south, -90.0), west=-180.0, north=min(north, 90.0), east=180.0)
+
+    delta_longitude = math.degrees(math.asin(math.sin(angular_radius) / math.cos(math.radians(latitude))))
+
+    west = longitude - delta_longitude
+    east = longitude + delta_longitude
+
+    # A box crossing the antimeridian keeps west > east, which Neo4j's point.withinBBox understands.
+    if west < -180.0:
+        west += 360.0
+    if east > 180.0:
+        east -= 360.0
+
+    return BoundingBox(south=south, west=west, north=north, east=east)
+
+
+def get_distance_km(latitude: float, longitude: float, other_latitude: float, other_longitude: float) -> float:
+    delta_latitude = math.radians(other_latitude - latitude)
+    delta_longitude = math.radians(other_longitude - longitude)
+
+    haversine = (
+        math.sin(delta_latitude / 2) ** 2
+        + math.cos(math.radians(latitude)) * math.cos(math.radians(other_latitude)) * math.sin(delta_longitude / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(haversine, 1.0)))
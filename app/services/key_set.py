@@ -0,0 +1,148 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import json
+import os
+import time
+
+from loguru import logger
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+KeyId = Tuple[str | None, str]
+
+KEY_TYPES = {"RS": "RSA", "PS": "RSA", "ES": "EC"}
+
+
+class KeySet:
+    def __init__(self, path: Path, algorithms: List[str], reload_interval: float = 5.0) -> None:
+        self._path = path
+        self._algorithms = algorithms
+        self._reload_interval = reload_interval
+        self._lock = Lock()
+        self._checked_at = time.monotonic()
+        self._modified_at = os.stat(path).st_mtime_ns
+        self._keys = self._load()
+
+    @property
+    def algorithms(self) -> List[str]:
+        return self._algorithms
+
+    def get_key(self, token: str) -> Key | None:
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            return None
+
+        algorithm = header.get("alg")
+        if algorithm not in self._algorithms:
+            return None
+
+        self._reload_if_changed()
+
+        key = self._find_key(header.get("kid"), algorithm)
+        if key is None and self._reload_if_changed(force=True):
+            key = self._find_key(header.get("kid"), algorithm)
+
+        return key
+
+    def _find_key(self, kid: str | None, algorithm: str) -> Key | None:
+        keys = self._keys
+
+        key = keys.get((kid, algorithm))
+        if key is not None or kid is not None:
+            return key
+
+        candidates = [key for (_, key_algorithm), key in keys.items() if key_algorithm == algorithm]
+        if len(candidates) == 1:
+            return candidates[0]
+
+        return None
+
+    def _reload_if_changed(self, force: bool = False) -> bool:
+        now = time.monotonic()
+        if not force and now - self._checked_at < self._reload_interval:
+            return False
+
+        with self._lock:
+            self._checked_at = now
+
+            try:
+                modified_at = os.stat(self._path).st_mtime_ns
+            except OSError as exception:
+                logger.error(exception)
+                return False
+
+            if modified_at == self._modified_at:
+                return False
+
+            try:
+                keys = self._load()
+            except (JWKError, OSError, ValueError) as exception:
+                logger.error("Keeping previous keys, reload of {path} failed: {error}", path=self._path, error=exception)
+                return False
+
+            self._keys = keys
+            self._modified_at = modified_at
+
+        logger.info("Reloaded {count} verification key(s) from {path}", count=len(keys), path=self._path)
+        return True
+
+    @staticmethod
+    def _construct_key(entry: Dict[str, Any] | str, algorithm: str) -> Key | None:
+        try:
+            key = jwk.construct(entry, algorithm)
+            key_type = key.to_dict().get("kty")
+        except (AttributeError, JWKError, ValueError):
+            return None
+
+        # jwk.construct does not reject a PEM of the wrong family, so the parsed key type is checked as well.
+        if key_type != KEY_TYPES.get(algorithm[:2]):
+            return None
+
+        return key
+
+    def _load(self) -> Dict[KeyId, Key]:
+        with open(self._path) as f:
+            content = f.read()
+
+        if content.lstrip().startswith("{"):
+            data = json.loads(content)
+            entries: List[Dict[str, Any] | str] = data["keys"] if "keys" in data else [data]
+        else:
+            entries = [content]
+
+        keys: Dict[KeyId, Key] = {}
+
+        for entry in entries:
+            kid = entry.get("kid") if isinstance(entry, dict) else None
+            algorithm = entry.get("alg") if isinstance(entry, dict) else None
+
+            for candidate in [algorithm] if algorithm else self._algorithms:
+                if candidate not in self._algorithms:
+                    continue
+
+                key = self._construct_key(entry, candidate)
+                if key is not None:
+                    keys[(kid, candidate)] = key
+
+        if not keys:
+            raise JWKError(f"No usable keys for {', '.join(self._algorithms)} in {self._path}")
+
+        return keys
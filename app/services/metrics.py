@@ -0,0 +1,191 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import bisect
+import math
+import threading
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if not label_names:
+        return ""
+
+    labels = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(label_names, label_values))
+
+    return f"{{{labels}}}"
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def collect(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._collect_samples()
+
+    @abstractmethod
+    def _collect_samples(self) -> Iterator[str]:
+        ...
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def _collect_samples(self) -> Iterator[str]:
+        with self._lock:
+            values = list(self._values.items())
+
+        for label_values, value in values:
+            yield f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), kind: str = "gauge") -> None:
+        super().__init__(name, documentation, label_names)
+        self.kind = kind
+
+    def set(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            label_names: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._buckets = tuple(buckets)
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = ([0] * (len(self._buckets) + 1), [0.0])
+
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def _collect_samples(self) -> Iterator[str]:
+        with self._lock:
+            values = [(label_values, list(counts), total[0]) for label_values, (counts, total) in self._values.items()]
+
+        label_names = (*self.label_names, "le")
+
+        for label_values, counts, total in values:
+            cumulative = 0
+
+            for bound, count in zip((*self._buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels(label_names, (*label_values, _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self._metrics for line in metric.collect()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP responses by route and status.", ("method", "route", "status"),
+))
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route"),
+))
+
+QUERY_DURATION = REGISTRY.register(Histogram(
+    "neo4j_query_duration_seconds", "Managed transaction latency, retries included.", ("repository", "method"),
+))
+QUERY_ERRORS = REGISTRY.register(Counter(
+    "neo4j_query_errors_total", "Managed transactions that failed after retries.", ("repository", "method"),
+))
+
+POOL_MAX_SIZE = REGISTRY.register(Gauge("neo4j_pool_max_size", "Configured driver connection pool size."))
+POOL_CONNECTIONS = REGISTRY.register(Gauge("neo4j_pool_connections", "Driver connections by state.", ("state",)))
+SESSIONS_ACTIVE = REGISTRY.register(Gauge("neo4j_sessions_active", "Sessions currently open."))
+SESSIONS_OPENED = REGISTRY.register(Gauge("neo4j_sessions_opened_total", "Sessions opened.", kind="counter"))
+
+JWT_VERIFICATIONS = REGISTRY.register(Counter(
+    "jwt_verifications_total", "Access token checks by result.", ("result",),
+))
+
+CACHE_HITS = REGISTRY.register(Gauge("cache_hits_total", "Cache hits.", ("cache",), kind="counter"))
+CACHE_MISSES = REGISTRY.register(Gauge("cache_misses_total", "Cache misses.", ("cache",), kind="counter"))
+CACHE_HIT_RATIO = REGISTRY.register(Gauge("cache_hit_ratio", "Cache hits over lookups since start.", ("cache",)))
+CACHE_SIZE = REGISTRY.register(Gauge("cache_size", "Cache entries.", ("cache",)))
+
+READ_MODEL_SIZE = REGISTRY.register(Gauge("read_model_events", "Events held by the read model."))
+READ_MODEL_SYNC_AGE = REGISTRY.register(Gauge("read_model_sync_age_seconds", "Time since the last read model sync."))
+READ_MODEL_CHANGE_LAG = REGISTRY.register(Gauge(
+    "read_model_change_lag_seconds", "Delay between a write and its sync into the read model.",
+))
+READ_MODEL_SYNC_ERRORS = REGISTRY.register(Gauge(
+    "read_model_sync_errors_total", "Failed read model syncs.", kind="counter",
+))
@@ -0,0 +1,253 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import bisect
+import math
+import time
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from loguru import logger
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from app.core.settings.app import AppSettings
+from app.database.pool import SessionPool
+from app.database.repositories.event_repository import MIN_START_AT, EventRepository
+from app.models.domain.event import Event
+from app.models.schemas.system import ReadModelStats
+from app.services.geo import get_bounding_box, get_distance_km
+from app.services.utc import utc_now
+
+
+class EventReadModel:
+    def __init__(
+            self,
+            pool: SessionPool,
+            poll_interval: float,
+            reconcile_interval: float,
+            sync_overlap: float,
+            cell_size: float,
+    ) -> None:
+        self._pool = pool
+        self._poll_interval = poll_interval
+        self._reconcile_interval = reconcile_interval
+        self._sync_overlap = timedelta(seconds=sync_overlap)
+        self._cell_size = cell_size
+
+        self._events: Dict[int, Event] = {}
+        self._order: List[Tuple[datetime, int]] = []
+        self._cells: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+
+        self._starts_after: datetime | None = None
+        self._updated_after: datetime | None = None
+        self._reconciled_at = 0.0
+        self._synced_at: datetime | None = None
+        self._change_lag: float | None = None
+        self._syncs = 0
+        self._sync_errors = 0
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(cls, pool: SessionPool, settings: AppSettings) -> "EventReadModel":
+        return cls(
+            pool,
+            settings.read_model_poll_interval,
+            settings.read_model_reconcile_interval,
+            settings.read_model_sync_overlap,
+            settings.read_model_cell_size,
+        )
+
+    def covers(self, starts_after: datetime | None) -> bool:
+        return self._starts_after is not None and starts_after is not None and starts_after >= self._starts_after
+
+    async def start(self) -> None:
+        await self.sync()
+        self._task = asyncio.create_task(self._poll())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval)
+
+            try:
+                await self.sync()
+            except Exception as exception:
+                self._sync_errors += 1
+                logger.warning("Event read model sync failed: {exception}", exception=exception)
+
+    async def sync(self) -> None:
+        # The first sync always reconciles, a freshly booted host may have a monotonic clock below the interval.
+        is_reconcile = self._starts_after is None or time.monotonic() - self._reconciled_at >= self._reconcile_interval
+        starts_after = utc_now() if is_reconcile else self._starts_after
+
+        # Writers' clocks may lag behind ours, so every poll re-reads a short overlap.
+        updated_after = self._updated_after - self._sync_overlap if self._updated_after else MIN_START_AT
+
+        async with self._pool.session() as session:
+            event_repository = EventRepository(session)
+
+            events = event_repository.iterate_events_updated_after(updated_after, starts_after)
+            changed_events = [event async for event in events]
+
+            event_ids = await event_repository.get_event_ids(starts_after) if is_reconcile else None
+
+            # Writes committed behind the polled overlap never show up as changes, so reconcile loads them by id.
+            if event_ids:
+                missing_ids = event_ids - set(self._events) - {event.id for event in changed_events}
+                if missing_ids:
+                    changed_events += [event async for event in event_repository.iterate_events_by_ids(missing_ids)]
+
+        if event_ids is not None:
+            self._starts_after = starts_after
+
+        synced_at = utc_now()
+        change_lags: List[float] = []
+
+        for event in changed_events:
+            # An update may move an event out of the window, and its previous copy must go with it.
+            if event.start_at < self._starts_after:
+                self._remove(event.id)
+                continue
+
+            previous_event = self._events.get(event.id)
+            if previous_event is not None and previous_event.updated_at >= event.updated_at:
+                continue
+
+            self._remove(event.id)
+            self._add(event)
+
+            self._updated_after = max(self._updated_after or event.updated_at, event.updated_at)
+            change_lags.append((synced_at - event.updated_at).total_seconds())
+
+        if event_ids is not None:
+            # Deletes leave nothing to poll for, and started events leave the window.
+            for event_id in set(self._events) - event_ids:
+                self._remove(event_id)
+
+            self._reconciled_at = time.monotonic()
+
+        if change_lags and self._syncs:
+            self._change_lag = max(change_lags)
+
+        self._synced_at = synced_at
+        self._syncs += 1
+
+    async def get_events(
+            self,
+            limit: int,
+            offset: int,
+            after: Tuple[datetime, int] | None = None,
+            *,
+            starts_after: datetime | None = None,
+            starts_before: datetime | None = None,
+    ) -> List[Event]:
+        after = after or (MIN_START_AT, -1)
+        if starts_after and starts_after > after[0]:
+            after = (starts_after, -1)
+
+        events: List[Event] = []
+
+        for start_at, event_id in self._order[bisect.bisect_right(self._order, after) + offset:]:
+            if len(events) == limit or (starts_before and start_at >= starts_before):
+                break
+
+            events.append(self._events[event_id])
+
+        return events
+
+    async def get_events_near(
+            self,
+            latitude: float,
+            longitude: float,
+            radius_km: float,
+            limit: int,
+            offset: int,
+            *,
+            starts_after: datetime | None = None,
+            starts_before: datetime | None = None,
+    ) -> List[Event]:
+        candidates: List[Tuple[float, int]] = []
+
+        for cell in self._get_cells(latitude, longitude, radius_km):
+            for event_id in self._cells.get(cell, ()):
+                event = self._events[event_id]
+
+                if starts_after and event.start_at < starts_after:
+                    continue
+                if starts_before and event.start_at >= starts_before:
+                    continue
+
+                distance = get_distance_km(latitude, longitude, event.location.latitude, event.location.longitude)
+                if distance <= radius_km:
+                    candidates.append((distance, event_id))
+
+        candidates.sort()
+
+        return [self._events[event_id] for _, event_id in candidates[offset:offset + limit]]
+
+    def stats(self) -> ReadModelStats:
+        return ReadModelStats(
+            size=len(self._events),
+            starts_after=self._starts_after,
+            synced_at=self._synced_at,
+            sync_age_seconds=(utc_now() - self._synced_at).total_seconds() if self._synced_at else None,
+            change_lag_seconds=self._change_lag,
+            syncs=self._syncs,
+            sync_errors=self._sync_errors,
+        )
+
+    def _add(self, event: Event) -> None:
+        self._events[event.id] = event
+        bisect.insort(self._order, (event.start_at, event.id))
+        self._cells[self._get_cell(event.location.latitude, event.location.longitude)].add(event.id)
+
+    def _remove(self, event_id: int) -> None:
+        event = self._events.pop(event_id, None)
+        if event is None:
+            return
+
+        index = bisect.bisect_left(self._order, (event.start_at, event_id))
+        del self._order[index]
+
+        cell = self._get_cell(event.location.latitude, event.location.longitude)
+        self._cells[cell].discard(event_id)
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+    def _get_cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return math.floor(latitude / self._cell_size), math.floor(longitude / self._cell_size)
+
+    def _get_cells(self, latitude: float, longitude: float, radius_km: float) -> Iterator[Tuple[int, int]]:
+        bounding_box = get_bounding_box(latitude, longitude, radius_km)
+
+        south, west = self._get_cell(bounding_box.south, bounding_box.west)
+        north, east = self._get_cell(bounding_box.north, bounding_box.east)
+
+        if bounding_box.west > bounding_box.east:
+            columns: Iterable[int] = (
+                *range(west, self._get_cell(0, 180.0)[1] + 1),
+                *range(self._get_cell(0, -180.0)[1], east + 1),
+            )
+        else:
+            columns = range(west, east + 1)
+
+        for row in range(south, north + 1):
+            for column in columns:
+                yield row, column
@@ -0,0 +1,193 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import hashlib
+import re
+import threading
+import time
+
+from loguru import logger
+from typing import Any, Dict, List, Set
+from neo4j import AsyncManagedTransaction, ResultSummary
+
+from app.core.settings.app import AppSettings
+from app.database.pool import SessionPool
+from app.models.schemas.system import SlowQuery
+from app.services.utc import utc_now
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return f"<list[{len(value)}]>"
+
+    if value is None:
+        return None
+
+    return f"<{type(value).__name__}>"
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha1(WHITESPACE.sub(" ", query).strip().encode()).hexdigest()[:12]
+
+
+def _get_db_hits(profile: Dict[str, Any]) -> int:
+    return profile.get("dbHits", 0) + sum(_get_db_hits(child) for child in profile.get("children", []))
+
+
+def _get_plan_lines(profile: Dict[str, Any], depth: int = 0) -> List[str]:
+    line = "{indent}{operator} rows={rows} db_hits={db_hits}".format(
+        indent="  " * depth,
+        operator=profile.get("operatorType", "?"),
+        rows=profile.get("rows", 0),
+        db_hits=profile.get("dbHits", 0),
+    )
+
+    return [line, *(
+        plan_line for child in profile.get("children", []) for plan_line in _get_plan_lines(child, depth + 1)
+    )]
+
+
+async def _profile_transaction(tx: AsyncManagedTransaction, query: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    result = await tx.run(f"PROFILE {query}", **parameters)
+    summary = await result.consume()
+
+    return summary.profile or {}
+
+
+class SlowQueryLog:
+    def __init__(
+            self,
+            pool: SessionPool,
+            threshold: float,
+            max_size: int,
+            is_profile_enabled: bool,
+            profile_interval: float,
+    ) -> None:
+        self._pool = pool
+        self._threshold = threshold
+        self._max_size = max_size
+        self._is_profile_enabled = is_profile_enabled
+        self._profile_interval = profile_interval
+        self._queries: Dict[str, SlowQuery] = {}
+        self._profiled_at: Dict[str, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, pool: SessionPool, settings: AppSettings) -> "SlowQueryLog":
+        return cls(
+            pool,
+            settings.slow_query_threshold,
+            settings.slow_query_log_size,
+            settings.slow_query_profile,
+            settings.slow_query_profile_interval,
+        )
+
+    def capture(
+            self,
+            query: str,
+            parameters: Dict[str, Any],
+            source: str,
+            duration: float,
+            records: int,
+            summary: ResultSummary,
+    ) -> None:
+        if duration < self._threshold:
+            return
+
+        slow_query = SlowQuery(
+            query_hash=get_query_hash(query),
+            source=source,
+            query=WHITESPACE.sub(" ", query).strip(),
+            parameters=redact(parameters),
+            duration_ms=duration * 1000,
+            available_after_ms=summary.result_available_after,
+            consumed_after_ms=summary.result_consumed_after,
+            records=records,
+            recorded_at=utc_now(),
+        )
+
+        logger.warning(
+            "Slow query {query_hash} from {source}: {duration_ms:.1f} ms, "
+            "available after {available_after_ms} ms, consumed after {consumed_after_ms} ms, "
+            "{records} record(s), parameters {parameters}",
+            **slow_query.model_dump(),
+        )
+
+        if not self._add(slow_query):
+            return
+
+        # Profiling runs the statement again, which is only harmless for reads, and is
+        # done off the request path on its own session.
+        if self._is_profile_enabled and summary.query_type == "r" and self._is_profile_due(slow_query.query_hash):
+            task = asyncio.create_task(self._profile(slow_query, query, parameters))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def get_slowest(self, limit: int) -> List[SlowQuery]:
+        with self._lock:
+            queries = list(self._queries.values())
+
+        return sorted(queries, key=lambda slow_query: slow_query.duration_ms, reverse=True)[:limit]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _profile(self, slow_query: SlowQuery, query: str, parameters: Dict[str, Any]) -> None:
+        try:
+            async with self._pool.session() as session:
+                profile = await session.execute_read(_profile_transaction, query, parameters)
+        except Exception as error:
+            logger.warning("Failed to profile slow query {query_hash}: {error}", query_hash=slow_query.query_hash, error=error)
+            return
+
+        with self._lock:
+            slow_query.db_hits = _get_db_hits(profile)
+            slow_query.plan = _get_plan_lines(profile)
+
+    def _is_profile_due(self, query_hash: str) -> bool:
+        now = time.monotonic()
+
+        with self._lock:
+            profiled_at = self._profiled_at.get(query_hash)
+            if profiled_at is not None and now - profiled_at < self._profile_interval:
+                return False
+
+            self._profiled_at[query_hash] = now
+            return True
+
+    def _add(self, slow_query: SlowQuery) -> bool:
+        with self._lock:
+            previous = self._queries.get(slow_query.query_hash)
+            if previous is not None and previous.duration_ms >= slow_query.duration_ms:
+                return False
+
+            self._queries[slow_query.query_hash] = slow_query
+
+            if len(self._queries) > self._max_size:
+                fastest = min(self._queries.values(), key=lambda query: query.duration_ms)
+                del self._queries[fastest.query_hash]
+                self._profiled_at.pop(fastest.query_hash, None)
+
+            return slow_query.query_hash in self._queries
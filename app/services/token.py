@@ -18,32 +18,64 @@ from jose import JWTError, jwt
 from pydantic import ValidationError
 
 from app.models.schemas.jwt import JWTUser
+from app.services.key_set import KeySet
+from app.services.metrics import JWT_VERIFICATIONS
+from app.services.token_cache import TokenCache
 
 JWT_ACCESS_SUBJECT = "access"
 JWT_REFRESH_SUBJECT = "refresh"
-ALGORITHM = "RS512"
 ACCESS_TOKEN_EXPIRE_MINUTES = 5
 REFRESH_TOKEN_EXPIRE_DAYS = 365
 
 
-def get_user_id_from_access_token(access_token: str, secret_key: str) -> int | None:
+def get_user_id_from_access_token(access_token: str, key_set: KeySet, token_cache: TokenCache | None = None) -> int | None:
+    if token_cache is not None:
+        user_id = token_cache.get(access_token)
+        if user_id is not None:
+            JWT_VERIFICATIONS.inc("cached")
+            return user_id
+
+    key = key_set.get_key(access_token)
+    if key is None:
+        JWT_VERIFICATIONS.inc("unknown_key")
+        return None
+
     try:
-        token_date = jwt.decode(access_token, secret_key, algorithms=[ALGORITHM], subject=JWT_ACCESS_SUBJECT)
+        token_date = jwt.decode(access_token, key, algorithms=key_set.algorithms, subject=JWT_ACCESS_SUBJECT)
         user_data = JWTUser(**token_date)
     except JWTError:
+        JWT_VERIFICATIONS.inc("invalid")
         return None
     except ValidationError:
+        JWT_VERIFICATIONS.inc("invalid")
         return None
     except ValueError:
+        JWT_VERIFICATIONS.inc("invalid")
         return None
 
+    JWT_VERIFICATIONS.inc("valid")
     user_id = user_data.user_id
+
+    expires_at = token_date.get("exp")
+    if token_cache is not None and isinstance(expires_at, (int, float)):
+        token_cache.set(access_token, user_id, expires_at)
+
     return user_id
 
 
-def get_user_id_from_refresh_token(access_token: str, refresh_token: str, secret_key: str) -> int | None:
+def get_user_id_from_refresh_token(access_token: str, refresh_token: str, key_set: KeySet) -> int | None:
+    key = key_set.get_key(refresh_token)
+    if key is None:
+        return None
+
     try:
-        token_date = jwt.decode(refresh_token, secret_key, algorithms=[ALGORITHM], subject=JWT_REFRESH_SUBJECT, access_token=access_token)
+        token_date = jwt.decode(
+            refresh_token,
+            key,
+            algorithms=key_set.algorithms,
+            subject=JWT_REFRESH_SUBJECT,
+            access_token=access_token,
+        )
         user_data = JWTUser(**token_date)
     except JWTError:
         return None
@@ -0,0 +1,85 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+import time
+
+from loguru import logger
+from jose import JWTError, jwt
+from jose.utils import base64url_encode
+from neo4j import AsyncManagedTransaction
+
+from app.database.pool import SessionPool
+from app.database.repositories.event_repository import EventRepository
+from app.services.key_set import KeySet
+from app.services.token import JWT_ACCESS_SUBJECT
+
+
+async def _ping(tx: AsyncManagedTransaction) -> None:
+    result = await tx.run("RETURN 1")
+    await result.consume()
+
+
+async def warm_up_connections(pool: SessionPool, count: int) -> None:
+    async def open_connection() -> None:
+        async with pool.session() as session:
+            await session.execute_read(_ping)
+
+    # Concurrent sessions each take their own connection, which stays idle in the driver pool afterwards.
+    await asyncio.gather(*(open_connection() for _ in range(count)))
+
+
+async def warm_up_queries(pool: SessionPool) -> int:
+    async with pool.session() as session:
+        return await EventRepository(session).warm_up()
+
+
+def warm_up_token_verification(key_set: KeySet) -> None:
+    header = {"alg": key_set.algorithms[0], "typ": "JWT"}
+    claims = {"sub": JWT_ACCESS_SUBJECT, "user_id": 0}
+    token = b".".join(
+        base64url_encode(part)
+        for part in (json.dumps(header).encode(), json.dumps(claims).encode(), b"\0" * 256)
+    ).decode()
+
+    key = key_set.get_key(token)
+    if key is None:
+        return
+
+    # The signature never matches, the point is to load the verification path before the first request.
+    try:
+        jwt.decode(token, key, algorithms=key_set.algorithms, subject=JWT_ACCESS_SUBJECT)
+    except JWTError:
+        pass
+
+
+async def warm_up(pool: SessionPool, key_set: KeySet, connections: int) -> None:
+    started_at = time.perf_counter()
+
+    try:
+        await warm_up_connections(pool, connections)
+        queries = await warm_up_queries(pool)
+    except Exception as exception:
+        logger.warning("Database warm-up failed: {exception}", exception=exception)
+        queries = 0
+
+    warm_up_token_verification(key_set)
+
+    logger.info(
+        "Warmed up {connections} connection(s) and {queries} query plan(s) in {duration:.2f} s",
+        connections=connections,
+        queries=queries,
+        duration=time.perf_counter() - started_at,
+    )
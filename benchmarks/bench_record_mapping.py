@@ -0,0 +1,120 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import time
+
+from datetime import datetime
+from neo4j import Record
+from neo4j._codec.hydration.v2.temporal import hydrate_datetime
+
+from app.database.repositories.event_repository import EventRepository
+from app.models.domain.event import Event
+from app.models.domain.location import Location
+
+RECORDS = 10000
+
+START_AT_SECONDS = 1714546800
+START_AT_NANOSECONDS = 123456000
+START_AT_OFFSET = 3 * 60 * 60
+START_AT = "2024-05-01T10:00:00.123456+03:00"
+
+EVENT = {
+    "title": "Ride",
+    "subtitle": "Weekend ride",
+    "text": "Meet at the fuel station, leave at ten sharp.",
+    "picture": "https://example.com/pictures/ride.png",
+}
+
+LOCATION = {
+    "name": "Minsk",
+    "description": "",
+    "address": "Nezavisimosti 1",
+    "latitude": 53.9,
+    "longitude": 27.56,
+}
+
+
+def _get_node_record(event_id: int) -> Record:
+    # The driver hydrates every temporal property of a node it returns.
+    start_at, created_at, updated_at = (
+        hydrate_datetime(START_AT_SECONDS, START_AT_NANOSECONDS, START_AT_OFFSET) for _ in range(3)
+    )
+
+    return Record({
+        "event_id": event_id,
+        "event": {**EVENT, "start_at": start_at, "created_at": created_at, "updated_at": updated_at},
+        "location": {**LOCATION, "point": None},
+    })
+
+
+def _get_projected_record(event_id: int) -> Record:
+    return Record({
+        "row": {
+            **EVENT,
+            "id": event_id,
+            "start_at": START_AT,
+            "created_at": START_AT,
+            "updated_at": START_AT,
+            "location": LOCATION,
+        },
+    })
+
+
+def _get_event_from_node_record(record: Record) -> Event:
+    location = Location(
+        name=record["location"]["name"],
+        description=record["location"]["description"],
+        address=record["location"]["address"],
+        latitude=record["location"]["latitude"],
+        longitude=record["location"]["longitude"],
+    )
+
+    return Event(
+        id=record["event_id"],
+        title=record["event"]["title"],
+        subtitle=record["event"]["subtitle"],
+        text=record["event"]["text"],
+        picture=record["event"]["picture"],
+        location=location,
+        start_at=datetime.fromisoformat(str(record["event"]["start_at"])),
+        created_at=datetime.fromisoformat(str(record["event"]["created_at"])),
+        updated_at=datetime.fromisoformat(str(record["event"]["updated_at"])),
+    )
+
+
+def _measure(name: str, get_record, get_event) -> float:
+    started_at = time.perf_counter()
+    for event_id in range(RECORDS):
+        get_event(get_record(event_id))
+    elapsed = time.perf_counter() - started_at
+
+    print(f"{name:<28} {elapsed * 1000:>8.1f} ms per {RECORDS} records")
+
+    return elapsed
+
+
+def main() -> None:
+    node_event = _get_event_from_node_record(_get_node_record(1))
+    projected_event = EventRepository.get_event_from_record(_get_projected_record(1))
+    assert node_event.model_dump_json() == projected_event.model_dump_json()
+
+    node_elapsed = _measure("nodes, field by field", _get_node_record, _get_event_from_node_record)
+    projected_elapsed = _measure("projected rows", _get_projected_record, EventRepository.get_event_from_record)
+
+    print(f"speedup: {node_elapsed / projected_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+"""
+Route benchmarks against the real application with an in-memory stand-in for Neo4j.
+
+    DATABASE_PASS=... PUBLIC_KEY_PATH=... python -m benchmarks.bench_routes --compare benchmarks/results/<previous>.json
+"""
+
+import argparse
+import asyncio
+import bisect
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Tuple
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+from jose import jwt
+from neo4j import Bookmarks, Record
+
+from app.core.config import get_app_settings
+from app.database.repositories.event_repository import EventRepository
+from app.models.schemas.event import EventCreate
+from app.services.key_set import KeySet
+from app.services.token import JWT_ACCESS_SUBJECT
+
+RESULTS_PATH = Path(__file__).parent / "results"
+
+USER_ID = 1
+SEED_EVENTS = 1000
+
+
+class MemoryResult(object):
+
+    def __init__(self, records: List[Record], nodes_deleted: int = 0) -> None:
+        self._records = records
+        self._summary = SimpleNamespace(counters=SimpleNamespace(nodes_deleted=nodes_deleted))
+
+    async def single(self) -> Record | None:
+        return self._records[0] if self._records else None
+
+    async def consume(self) -> SimpleNamespace:
+        return self._summary
+
+    async def __aiter__(self) -> AsyncIterator[Record]:
+        for record in self._records:
+            yield record
+
+
+class MemorySession(object):
+    """Answers the event repository's queries by their parameters, standing in for a Neo4j session."""
+
+    def __init__(self) -> None:
+        self._rows: Dict[int, dict] = {}
+        self._order: List[Tuple[datetime, int]] = []
+        self._titles: Dict[str, int] = {}
+        self._authors: Dict[int, int] = {}
+        self._ids = itertools.count(1)
+
+    async def run(self, query: str, **parameters) -> MemoryResult:
+        if "created_at" in parameters:
+            return self._create(**parameters)
+        if "updated_at" in parameters:
+            return self._update(**parameters)
+        if "after_start_at" in parameters:
+            return self._list(**parameters)
+        if "user_id" in parameters:
+            return self._delete(**parameters)
+
+        return self._get(**parameters)
+
+    async def execute_read(self, work, *args):
+        return await work(self, *args)
+
+    async def execute_write(self, work, *args):
+        return await work(self, *args)
+
+    async def last_bookmarks(self) -> Bookmarks:
+        return Bookmarks.from_raw_values([f"memory:{len(self._rows)}"])
+
+    def _create(self, user_id: int, title: str, location: dict, start_at: datetime, created_at: datetime, **kwargs):
+        if title in self._titles:
+            return MemoryResult([Record({"row": None, "is_conflict": True, "is_author_found": True})])
+
+        event_id = next(self._ids)
+        row = {
+            "id": event_id,
+            "title": title,
+            "subtitle": kwargs["subtitle"],
+            "text": kwargs["text"],
+            "picture": kwargs["picture"],
+            "start_at": start_at.isoformat(),
+            "created_at": created_at.isoformat(),
+            "updated_at": created_at.isoformat(),
+            "location": location,
+        }
+
+        self._rows[event_id] = row
+        self._titles[title] = event_id
+        self._authors[event_id] = user_id
+        bisect.insort(self._order, (start_at, event_id))
+
+        return MemoryResult([Record({"row": row, "is_conflict": False, "is_author_found": True})])
+
+    def _list(self, limit: int, offset: int, after_start_at: datetime, after_id: int, before_start_at: datetime):
+        start = bisect.bisect_right(self._order, (after_start_at, after_id))
+        records: List[Record] = []
+
+        for start_at, event_id in itertools.islice(self._order, start + offset, None):
+            if start_at >= before_start_at or len(records) == limit:
+                break
+            records.append(Record({"row": self._rows[event_id]}))
+
+        return MemoryResult(records)
+
+    def _get(self, event_id: int):
+        row = self._rows.get(event_id)
+        return MemoryResult([Record({"row": row})] if row else [])
+
+    def _update(self, user_id: int, event_id: int, updated_at: datetime, **changes):
+        row = self._rows.get(event_id)
+        if row is None:
+            return MemoryResult([])
+
+        is_owner = self._authors[event_id] == user_id
+        if is_owner:
+            row.update({key: value for key, value in changes.items() if key in row and value is not None})
+            row["updated_at"] = updated_at.isoformat()
+
+        return MemoryResult([Record({"row": row, "is_owner": is_owner, "is_conflict": False})])
+
+    def _delete(self, user_id: int, event_id: int):
+        row = self._rows.get(event_id)
+        if row is None:
+            return MemoryResult([])
+
+        is_owner = self._authors[event_id] == user_id
+        if is_owner:
+            del self._rows[event_id]
+            del self._titles[row["title"]]
+            self._order.remove((datetime.fromisoformat(row["start_at"]), event_id))
+
+        return MemoryResult([Record({"is_owner": is_owner})], nodes_deleted=2 if is_owner else 0)
+
+
+class MemoryPool(object):
+
+    def __init__(self) -> None:
+        self._session = MemorySession()
+
+    @asynccontextmanager
+    async def session(self, bookmarks: Iterable[str] = (), **config) -> AsyncIterator[MemorySession]:
+        yield self._session
+
+
+def _get_event_body(title: str, start_at: datetime) -> dict:
+    return {
+        "title": title,
+        "subtitle": "Weekend ride",
+        "text": "Meet at the fuel station, leave at ten sharp.",
+        "picture": "https://example.com/pictures/ride.png",
+        "location": {"name": "Minsk", "address": "Nezavisimosti 1", "latitude": 53.9, "longitude": 27.56},
+        "start_at": start_at.isoformat(),
+    }
+
+
+def _create_application(directory: Path) -> Tuple[FastAPI, str]:
+    from app.app import get_application
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_key_path = directory / "public.pem"
+    public_key_path.write_bytes(private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ))
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+    application = get_application()
+    application.state.pool = MemoryPool()
+    application.state.key_set = KeySet(public_key_path, ["RS512"])
+
+    claims = {"user_id": USER_ID, "username": "rider", "sub": JWT_ACCESS_SUBJECT, "exp": int(time.time()) + 3600}
+    token = jwt.encode(claims, private_pem, algorithm="RS512")
+
+    return application, token
+
+
+async def _seed(application: FastAPI, count: int, prefix: str) -> List[int]:
+    started_at = datetime.now(timezone.utc) + timedelta(days=1)
+    event_ids: List[int] = []
+
+    async with application.state.pool.session() as session:
+        event_repository = EventRepository(session)
+
+        for index in range(count):
+            request = EventCreate.model_validate(_get_event_body(f"{prefix} {index}", started_at + timedelta(hours=index)))
+            event = await event_repository.create_event_by_user_id(USER_ID, **dict(request))
+            event_ids.append(event.id)
+
+    return event_ids
+
+
+async def _run_route(
+        name: str,
+        request: Callable[[int], Awaitable[Response]],
+        total: int,
+        concurrency: int,
+) -> dict:
+    counter = itertools.count()
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+
+        while (index := next(counter)) < total:
+            started_at = time.perf_counter()
+            response = await request(index)
+            latencies.append(time.perf_counter() - started_at)
+
+            if response.status_code >= 400:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    percentiles = statistics.quantiles(latencies, n=100)
+
+    result = {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(percentiles[49] * 1000, 3),
+        "p95_ms": round(percentiles[94] * 1000, 3),
+        "p99_ms": round(percentiles[98] * 1000, 3),
+    }
+
+    print(f"{name:<28} {result['rps']:>9.1f} rps  p50 {result['p50_ms']:>7.2f}  "
+          f"p95 {result['p95_ms']:>7.2f}  p99 {result['p99_ms']:>7.2f} ms  errors {errors}")
+
+    return result
+
+
+async def run(total: int, concurrency: int) -> Dict[str, dict]:
+    with tempfile.TemporaryDirectory() as directory:
+        application, token = _create_application(Path(directory))
+
+        await _seed(application, SEED_EVENTS, "Seed")
+        deleted_ids = await _seed(application, total, "Delete")
+        event_id = deleted_ids[0] - 1
+
+        headers = {"Authorization": f"{get_app_settings().jwt_token_prefix} {token}"}
+        starts_at = datetime.now(timezone.utc) + timedelta(days=30)
+
+        async with AsyncClient(app=application, base_url="http://benchmark") as client:
+            routes: Dict[str, Callable[[int], Awaitable[Response]]] = {
+                "create (authenticated)": lambda index: client.post(
+                    "/api/v1/events",
+                    json=_get_event_body(f"Create {index}", starts_at),
+                    headers=headers,
+                ),
+                "list (anonymous)": lambda index: client.get("/api/v1/events", params={"limit": 20}),
+                "list (authenticated)": lambda index: client.get("/api/v1/events", params={"limit": 20}, headers=headers),
+                "get (anonymous)": lambda index: client.get(f"/api/v1/events/{event_id}"),
+                "get (authenticated)": lambda index: client.get(f"/api/v1/events/{event_id}", headers=headers),
+                "patch (authenticated)": lambda index: client.patch(
+                    f"/api/v1/events/{event_id}",
+                    json={"subtitle": f"Revision {index}"},
+                    headers=headers,
+                ),
+                "delete (authenticated)": lambda index: client.delete(
+                    f"/api/v1/events/{deleted_ids[index]}",
+                    headers=headers,
+                ),
+            }
+
+            return {name: await _run_route(name, request, total, concurrency) for name, request in routes.items()}
+
+
+def _get_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _compare(results: Dict[str, dict], previous: Dict[str, dict]) -> None:
+    print(f"\n{'route':<28} {'rps':>9} {'p95':>9} {'p99':>9}")
+
+    for name, result in results.items():
+        if name not in previous:
+            continue
+
+        deltas = [
+            (result[key] - previous[name][key]) / previous[name][key] * 100 if previous[name][key] else 0.0
+            for key in ("rps", "p95_ms", "p99_ms")
+        ]
+        print(f"{name:<28} " + " ".join(f"{delta:>+8.1f}%" for delta in deltas))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark event routes in-process.")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent clients")
+    parser.add_argument("--output", type=Path, help="results file, benchmarks/results/<commit>.json by default")
+    parser.add_argument("--compare", type=Path, help="previous results file to compare against")
+    arguments = parser.parse_args()
+
+    commit = _get_commit()
+    results = asyncio.run(run(arguments.requests, arguments.concurrency))
+
+    output = arguments.output or RESULTS_PATH / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "python": platform.python_version(),
+        "requests": arguments.requests,
+        "concurrency": arguments.concurrency,
+        "routes": results,
+    }, indent=2))
+    print(f"\nresults saved to {output}")
+
+    if arguments.compare:
+        _compare(results, json.loads(arguments.compare.read_text())["routes"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import time
+
+from datetime import datetime, timedelta, timezone
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.responses.wrapper_response import WrapperJSONResponse
+from app.models.domain.event import Event
+from app.models.domain.location import Location
+from app.models.schemas.event import EventsResponse
+from app.models.schemas.wrapper import WrapperResponse
+
+EVENTS_PER_PAGE = 100
+ITERATIONS = 500
+
+
+def _create_page() -> WrapperResponse:
+    started_at = datetime(2024, 5, 1, 10, tzinfo=timezone(timedelta(hours=3)))
+
+    events = [
+        Event(
+            id=event_id,
+            title=f"Ride {event_id}",
+            subtitle="Weekend ride",
+            text="Meet at the fuel station, leave at ten sharp. " * 5,
+            picture=f"https://example.com/pictures/{event_id}.png",
+            location=Location(name="Minsk", address="Nezavisimosti 1", latitude=53.9 + event_id / 1000, longitude=27.56),
+            start_at=started_at + timedelta(hours=event_id),
+            created_at=started_at,
+            updated_at=started_at,
+        )
+        for event_id in range(EVENTS_PER_PAGE)
+    ]
+
+    return WrapperResponse(payload=EventsResponse(events=events, next_cursor="cursor"))
+
+
+async def _render_generic(field, content: WrapperResponse) -> bytes:
+    serialized = await serialize_response(field=field, response_content=content)
+    return JSONResponse(serialized).body
+
+
+async def main() -> None:
+    content = _create_page()
+    field = create_response_field(name="response", type_=WrapperResponse)
+
+    assert await _render_generic(field, content) == WrapperJSONResponse(content).body
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await _render_generic(field, content)
+    generic = (time.perf_counter() - started_at) / ITERATIONS
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        WrapperJSONResponse(content)
+    fast = (time.perf_counter() - started_at) / ITERATIONS
+
+    print(f"{EVENTS_PER_PAGE}-event page, generic FastAPI path: {generic * 1_000_000:>10.1f} us/request")
+    print(f"{EVENTS_PER_PAGE}-event page, WrapperJSONResponse:  {fast * 1_000_000:>10.1f} us/request")
+    print(f"speedup: {generic / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Callable
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+
+from app.services.key_set import KeySet
+from app.services.token import JWT_ACCESS_SUBJECT, get_user_id_from_access_token
+
+ITERATIONS = 2000
+
+
+def _pem_pair(private_key) -> tuple[str, str]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+
+    return private_pem, public_pem
+
+
+def _create_token(private_pem: str, algorithm: str) -> str:
+    claims = {"user_id": 1, "username": "rider", "sub": JWT_ACCESS_SUBJECT, "exp": int(time.time()) + 3600}
+    return jwt.encode(claims, private_pem, algorithm=algorithm)
+
+
+def _measure(name: str, verify: Callable[[], object]) -> None:
+    assert verify()
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        verify()
+    elapsed = time.perf_counter() - started_at
+
+    print(f"{name:<32} {elapsed / ITERATIONS * 1_000_000:>10.1f} us/verify")
+
+
+def main() -> None:
+    rsa_private_pem, rsa_public_pem = _pem_pair(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    ec_private_pem, ec_public_pem = _pem_pair(ec.generate_private_key(ec.SECP256R1()))
+
+    rsa_token = _create_token(rsa_private_pem, "RS512")
+    ec_token = _create_token(ec_private_pem, "ES256")
+
+    with tempfile.TemporaryDirectory() as directory:
+        rsa_path = Path(directory) / "rsa.pem"
+        rsa_path.write_text(rsa_public_pem)
+        ec_path = Path(directory) / "ec.pem"
+        ec_path.write_text(ec_public_pem)
+
+        rsa_key_set = KeySet(rsa_path, ["RS512"])
+        ec_key_set = KeySet(ec_path, ["ES256"])
+
+        _measure(
+            "RS512, PEM parsed per call",
+            lambda: jwt.decode(rsa_token, rsa_public_pem, algorithms=["RS512"], subject=JWT_ACCESS_SUBJECT),
+        )
+        _measure("RS512, preloaded key set", lambda: get_user_id_from_access_token(rsa_token, rsa_key_set))
+        _measure(
+            "ES256, PEM parsed per call",
+            lambda: jwt.decode(ec_token, ec_public_pem, algorithms=["ES256"], subject=JWT_ACCESS_SUBJECT),
+        )
+        _measure("ES256, preloaded key set", lambda: get_user_id_from_access_token(ec_token, ec_key_set))
+
+
+if __name__ == "__main__":
+    main()
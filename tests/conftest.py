@@ -65,7 +65,9 @@ async def session(driver: AsyncDriver):
 
 @pytest.fixture
 def initialized_app(app: FastAPI, session) -> FastAPI:
-    app.state.session = session
+    from app.api.dependencies.database import _get_db_session
+
+    app.dependency_overrides[_get_db_session] = lambda: session
     return app
 
 
@@ -0,0 +1,107 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Tuple
+from neo4j import Record
+
+EVENT_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def get_row(
+        event_id: int,
+        start_at: datetime | None = None,
+        latitude: float = 53.9,
+        longitude: float = 27.56,
+        updated_at: datetime = EVENT_TIME,
+) -> dict:
+    start_at = start_at or datetime(2030, 1, 1, tzinfo=timezone.utc) + timedelta(days=event_id)
+
+    return {
+        "id": event_id,
+        "title": f"Ride {event_id}",
+        "subtitle": "",
+        "text": "Ride",
+        "picture": "https://example.com/ride.png",
+        "start_at": start_at.isoformat(),
+        "created_at": updated_at.isoformat(),
+        "updated_at": updated_at.isoformat(),
+        "location": {"name": "", "description": "", "address": "", "latitude": latitude, "longitude": longitude},
+    }
+
+
+def get_summary(query_type: str = "r", profile: dict | None = None) -> SimpleNamespace:
+    return SimpleNamespace(query_type=query_type, result_available_after=4, result_consumed_after=6, profile=profile)
+
+
+class LocalResult:
+    def __init__(self, records: Iterable[Record] = (), summary: SimpleNamespace | None = None) -> None:
+        self.records = list(records)
+        self.summary = summary or get_summary()
+        self.fetched = 0
+
+    async def __aiter__(self) -> AsyncIterator[Record]:
+        for record in self.records:
+            self.fetched += 1
+            yield record
+
+    async def consume(self) -> SimpleNamespace:
+        return self.summary
+
+
+class LocalTransaction:
+    def __init__(self, session: "LocalSession", access_mode: str) -> None:
+        self.session = session
+        self.access_mode = access_mode
+
+    async def __aenter__(self) -> "LocalTransaction":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+    async def run(self, query: str, **parameters) -> LocalResult:
+        self.session.queries.append((self.access_mode, query))
+        return self.session.answer(query, parameters)
+
+
+class LocalSession:
+    """Records the queries run through it and answers each one with `answer`, an empty result by default."""
+
+    def __init__(self, answer: Callable[[str, Dict[str, Any]], LocalResult] | None = None) -> None:
+        self.answer = answer or (lambda query, parameters: LocalResult())
+        self.queries: List[Tuple[str, str]] = []
+
+    async def execute_read(self, work, *args):
+        return await work(LocalTransaction(self, "read"), *args)
+
+    async def execute_write(self, work, *args):
+        return await work(LocalTransaction(self, "write"), *args)
+
+    async def begin_transaction(self) -> LocalTransaction:
+        return LocalTransaction(self, "explicit")
+
+
+class LocalPool:
+    def __init__(self, session: LocalSession | None = None) -> None:
+        self.local_session = session or LocalSession()
+        self.configs: List[Dict[str, Any]] = []
+
+    @asynccontextmanager
+    async def session(self, bookmarks: Iterable[str] = (), **config: Any) -> AsyncIterator[LocalSession]:
+        self.configs.append(config)
+        yield self.local_session
@@ -0,0 +1,57 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from typing import List
+from loguru import logger
+from starlette.types import Receive, Scope, Send
+
+from app.api.middlewares.access_log import AccessLogMiddleware
+
+
+def _create_application(status_code: int):
+    async def application(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": status_code, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return application
+
+
+async def _request(middleware: AccessLogMiddleware) -> None:
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    await middleware({"type": "http", "method": "GET", "path": "/api/v1/events"}, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_access_log_keeps_errors_and_slow_requests():
+    records: List[dict] = []
+    handler_id = logger.add(lambda message: records.append(message.record), level="INFO")
+
+    try:
+        await _request(AccessLogMiddleware(_create_application(200), sample_rate=0, slow_threshold=60))
+        await _request(AccessLogMiddleware(_create_application(503), sample_rate=0, slow_threshold=60))
+        await _request(AccessLogMiddleware(_create_application(200), sample_rate=0, slow_threshold=0))
+        await _request(AccessLogMiddleware(_create_application(404), sample_rate=1, slow_threshold=60))
+    finally:
+        logger.remove(handler_id)
+
+    assert [record["extra"]["status_code"] for record in records] == [503, 200, 404]
+    assert [record["level"].name for record in records] == ["WARNING", "INFO", "INFO"]
+    assert records[0]["extra"]["path"] == "/api/v1/events"
@@ -11,3 +11,198 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import base64
+import pytest
+
+from types import SimpleNamespace
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from neo4j.exceptions import Neo4jError
+
+from app.api.dependencies.authentication import _get_user_id_from_token
+from app.api.dependencies.database import _get_db_session
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.database.errors import EntityAccessDenied, EntityAlreadyExists, EntityCreateError, EntityDoesNotExists
+from app.database.repositories.event_repository import EventRepository
+from tests.fakes import LocalPool, LocalResult, LocalSession
+
+
+def _answer_bookmark_timeout(query: str, parameters: dict) -> LocalResult:
+    raise Neo4jError._hydrate_neo4j(code="Neo.TransientError.Transaction.BookmarkTimeout", message="Timeout")
+
+
+def _raise(error: type[Exception]):
+    async def method(self, *args, **kwargs):
+        raise error
+
+    return method
+
+
+def _authorize(app: FastAPI) -> None:
+    app.dependency_overrides[_get_db_session] = lambda: None
+    app.dependency_overrides[_get_user_id_from_token] = lambda: 1
+
+
+def _get_event_body(title: str) -> dict:
+    return {
+        "title": title,
+        "text": "Ride",
+        "picture": "https://example.com/ride.png",
+        "location": {"name": "Minsk", "latitude": 53.9, "longitude": 27.56},
+        "start_at": "2030-05-01T10:00:00+00:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_committed_chunks_when_a_later_chunk_fails(app: FastAPI, settings: AppSettings, monkeypatch):
+    async def create_events_by_user_id(self, user_id, events):
+        if events[0][0] >= 2:
+            raise EntityAlreadyExists
+
+        return {index: 100 + index for index, _ in events}
+
+    async def get_bookmarks(self):
+        return []
+
+    monkeypatch.setattr(EventRepository, "create_events_by_user_id", create_events_by_user_id)
+    monkeypatch.setattr(EventRepository, "get_bookmarks", get_bookmarks)
+    _authorize(app)
+    app.dependency_overrides[get_app_settings] = lambda: settings.model_copy(update={"events_batch_chunk_size": 2})
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.post("/api/v1/events/batch", json=[_get_event_body(f"Ride {index}") for index in range(4)])
+
+    assert response.status_code == status.HTTP_200_OK
+
+    payload = response.json()["payload"]
+    assert (payload["created"], payload["failed"]) == (2, 2)
+    assert [(result["status"], result["event_id"]) for result in payload["results"]] == [
+        ("created", 100),
+        ("created", 101),
+        ("failed", None),
+        ("failed", None),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "bookmarks",
+    ["FB:kcwQ, not a bookmark", ",".join(["FB:kcwQ"] * 17), "FB:" + "a" * 512],
+    ids=["format", "count", "length"],
+)
+async def test_malformed_bookmarks_are_rejected(app: FastAPI, bookmarks: str):
+    app.state.pool = LocalPool()
+    app.dependency_overrides[_get_db_session] = lambda: None
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.get("/api/v1/events", headers={"X-Bookmarks": bookmarks})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["message"] == "X-Bookmarks header holds unknown or unreachable bookmarks"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept", ["application/json", "application/x-ndjson"])
+async def test_unreached_bookmarks_are_a_bad_request(app: FastAPI, accept: str):
+    app.state.pool = LocalPool(LocalSession(_answer_bookmark_timeout))
+    app.dependency_overrides[_get_db_session] = lambda: app.state.pool.local_session
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.get("/api/v1/events", headers={"X-Bookmarks": "FB:kcwQ", "Accept": accept})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["message"] == "X-Bookmarks header holds unknown or unreachable bookmarks"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [{"starts_after": "0001-01-01T00:00:00+05:00"}, {"starts_before": "9999-12-31T23:00:00-05:00"}],
+    ids=["starts_after", "starts_before"],
+)
+async def test_time_window_outside_the_calendar_is_a_bad_request(app: FastAPI, params: dict):
+    app.state.pool = LocalPool()
+    app.dependency_overrides[_get_db_session] = lambda: None
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.get("/api/v1/events", params=params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["message"] == "starts_after must be earlier than starts_before"
+
+
+@pytest.mark.asyncio
+async def test_cursor_outside_the_calendar_is_a_bad_request(app: FastAPI):
+    app.state.pool = LocalPool()
+    app.dependency_overrides[_get_db_session] = lambda: None
+    cursor = base64.urlsafe_b64encode(b'["0001-01-01T00:00:00+05:00",1]').decode().rstrip("=")
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.get("/api/v1/events", params={"cursor": cursor, "upcoming": "false"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["message"] == "Wrong pagination cursor"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("method", "config"), [("GET", {"max_transaction_retry_time": 0}), ("POST", {}), ("DELETE", {})])
+async def test_only_bookmarked_reads_skip_transaction_retries(method: str, config: dict):
+    pool = LocalPool()
+
+    async for _ in _get_db_session(SimpleNamespace(method=method), pool, ["FB:kcwQ"]):
+        pass
+
+    async for _ in _get_db_session(SimpleNamespace(method=method), pool, []):
+        pass
+
+    assert pool.configs == [config, {}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("error", "status_code", "message"), [
+    (EntityDoesNotExists, status.HTTP_404_NOT_FOUND, "Event does not exist"),
+    (EntityAccessDenied, status.HTTP_403_FORBIDDEN, "Event belongs to another user"),
+    (EntityAlreadyExists, status.HTTP_409_CONFLICT, "Event is exists"),
+])
+async def test_update_event_maps_repository_errors(app: FastAPI, monkeypatch, error, status_code: int, message: str):
+    monkeypatch.setattr(EventRepository, "update_event_by_id", _raise(error))
+    _authorize(app)
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.patch("/api/v1/events/1", json={"title": "Ride"})
+
+    assert response.status_code == status_code
+    assert response.json() == {"success": False, "payload": None, "message": message}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("error", "status_code", "message"), [
+    (EntityAlreadyExists, status.HTTP_409_CONFLICT, "Event is exists"),
+    (EntityCreateError, status.HTTP_400_BAD_REQUEST, "Event create is error"),
+])
+async def test_create_event_maps_repository_errors(app: FastAPI, monkeypatch, error, status_code: int, message: str):
+    monkeypatch.setattr(EventRepository, "create_event_by_user_id", _raise(error))
+    _authorize(app)
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.post("/api/v1/events", json=_get_event_body("Ride"))
+
+    assert response.status_code == status_code
+    assert response.json() == {"success": False, "payload": None, "message": message}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("error", "status_code", "message"), [
+    (EntityAccessDenied, status.HTTP_403_FORBIDDEN, "Event belongs to another user"),
+    (EntityDoesNotExists, status.HTTP_404_NOT_FOUND, "Event does not exist"),
+])
+async def test_delete_event_maps_repository_errors(app: FastAPI, monkeypatch, error, status_code: int, message: str):
+    monkeypatch.setattr(EventRepository, "delete_event_by_id", _raise(error))
+    _authorize(app)
+
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.delete("/api/v1/events/1")
+
+    assert response.status_code == status_code
+    assert response.json() == {"success": False, "payload": None, "message": message}
@@ -0,0 +1,75 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.errors.http_error import http_error_handler
+from app.api.responses.wrapper_response import render_wrapper_response
+from app.models.domain.event import Event
+from app.models.domain.location import Location
+from app.models.schemas.event import EventResponse, EventSearchResult, EventsResponse, EventsSearchResponse
+from app.models.schemas.wrapper import WrapperResponse
+
+
+def _create_event(event_id: int, latitude: float, longitude: float) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Мотопробег \"{event_id}\"\n",
+        subtitle="Ride   out 😀",
+        text="Tab\there, slash / and backslash \\",
+        picture="https://example.com/picture.png?size=large",
+        location=Location(name="Минск", latitude=latitude, longitude=longitude),
+        start_at=datetime(2024, 5, 1, 10, 30, 15, 123456, tzinfo=timezone(timedelta(hours=3))),
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2024, 1, 2, 8, 0, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+    )
+
+
+async def _render_with_fastapi(content: WrapperResponse) -> bytes:
+    field = create_response_field(name="response", type_=WrapperResponse)
+    serialized = await serialize_response(field=field, response_content=content)
+    return JSONResponse(serialized).body
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("coordinates", [(53.9006, 27.559), (0.0, -0.0), (0.00001, 1e-7), (-89.999999, 179.123456789)])
+async def test_wrapper_response_is_byte_identical(coordinates):
+    events = [_create_event(event_id, *coordinates) for event_id in range(3)]
+
+    for content in (
+            WrapperResponse(payload=EventResponse(event=events[0])),
+            WrapperResponse(payload=EventsResponse(events=events, next_cursor="cursor")),
+            WrapperResponse(payload=EventsResponse(events=[])),
+            WrapperResponse(payload=EventsSearchResponse(results=[
+                EventSearchResult(event=event, score=score) for event, score in zip(events, (2.5, 0.0001234, 1e-7))
+            ])),
+    ):
+        assert render_wrapper_response(content) == await _render_with_fastapi(content)
+
+
+@pytest.mark.asyncio
+async def test_error_body_is_byte_identical():
+    for message in ("Event not found", "Событие не найдено"):
+        response = await http_error_handler(None, HTTPException(404, message))
+
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/json"
+        assert response.body == JSONResponse(WrapperResponse(success=False, message=message).model_dump()).body
@@ -0,0 +1,42 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_readiness_waits_for_startup(app: FastAPI):
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.get("/api/v1/system/ready")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json() == {"success": False, "payload": None, "message": "Service is not ready"}
+
+        app.state.is_ready = True
+        response = await client.get("/api/v1/system/ready")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["payload"] == {"ready": True}
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_endpoint_is_disabled_by_default(app: FastAPI):
+    async with AsyncClient(base_url="http://localhost:12345", app=app) as client:
+        response = await client.get("/api/v1/system/slow-queries")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"success": False, "payload": None, "message": "Slow query log endpoint is disabled"}
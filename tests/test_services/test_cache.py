@@ -0,0 +1,86 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+
+from typing import Dict
+
+from app.services.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+
+
+class LocalRedis:
+    def __init__(self) -> None:
+        self.values: Dict[str, bytes] = {}
+        self.expirations: Dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, px: int) -> None:
+        self.values[key] = value
+        self.expirations[key] = px
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_backend_evicts_least_recently_used():
+    cache = MemoryCacheBackend(ttl=60, max_size=2)
+
+    await cache.set("first", b"1")
+    await cache.set("second", b"2")
+    await cache.get("first")
+    await cache.set("third", b"3")
+
+    assert await cache.get("first") == b"1"
+    assert await cache.get("second") is None
+    assert await cache.get("third") == b"3"
+    assert cache.stats().size == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_backend_expires_entries():
+    cache = MemoryCacheBackend(ttl=60, max_size=2)
+
+    await cache.set("event", b"1", ttl=-1)
+
+    assert await cache.get("event") is None
+    assert cache.stats().misses == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_backend_uses_client():
+    client = LocalRedis()
+    cache = RedisCacheBackend(ttl=1.5, client=client)
+
+    await cache.set("event", b"1")
+
+    assert client.expirations["event"] == 1500
+    assert await cache.get("event") == b"1"
+
+    await cache.delete("event")
+
+    assert await cache.get("event") is None
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend(60)
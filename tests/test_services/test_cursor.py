@@ -0,0 +1,52 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import base64
+import pytest
+
+from datetime import datetime, timedelta, timezone
+
+from app.services.cursor import decode_cursor, encode_cursor
+
+
+def _encode_raw(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("event_id", [0, 1, -1, 2 ** 63 - 1, -2 ** 63])
+def test_cursor_round_trip(event_id):
+    start_at = datetime(2024, 5, 1, 10, 30, 15, 123456, tzinfo=timezone(timedelta(hours=3)))
+
+    assert decode_cursor(encode_cursor(start_at, event_id)) == (start_at, event_id)
+    assert decode_cursor(encode_cursor(start_at, event_id))[0].tzinfo == timezone.utc
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not base64!",
+    _encode_raw(b"not json"),
+    _encode_raw(b'{"start_at": "2024-05-01T10:00:00+00:00"}'),
+    _encode_raw(b'["2024-05-01T10:00:00+00:00"]'),
+    _encode_raw(b'["yesterday", 1]'),
+    _encode_raw(b'["2024-05-01T10:00:00", 1]'),
+    _encode_raw(b'["2024-05-01T10:00:00+00:00", "one"]'),
+    _encode_raw(b'["2024-05-01T10:00:00+00:00", null]'),
+    _encode_raw(b'["2024-05-01T10:00:00+00:00", 1e999]'),
+    _encode_raw(b'["2024-05-01T10:00:00+00:00", 9223372036854775808]'),
+    _encode_raw(b'["2024-05-01T10:00:00+00:00", -9223372036854775809]'),
+    _encode_raw(b'["0001-01-01T00:00:00+05:00", 1]'),
+    _encode_raw(b'["9999-12-31T23:00:00-05:00", 1]'),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    assert decode_cursor(cursor) is None
@@ -0,0 +1,34 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from app.services.etag import is_etag_matched
+
+ETAG = '"0123456789abcdef"'
+
+
+@pytest.mark.parametrize(("if_none_match", "is_matched"), [
+    (None, False),
+    ("", False),
+    (ETAG, True),
+    (f"W/{ETAG}", True),
+    ("*", True),
+    (f'"other", {ETAG}', True),
+    (f'"other",W/{ETAG}', True),
+    ('"other", W/"another"', False),
+    (ETAG.strip('"'), False),
+])
+def test_if_none_match(if_none_match, is_matched):
+    assert is_etag_matched(if_none_match, ETAG) is is_matched
@@ -0,0 +1,36 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+
+from neo4j import Record
+
+from app.database.repositories.event_repository import GET_EVENTS_QUERY, EventRepository
+from tests.fakes import LocalResult, LocalSession, get_row
+
+
+@pytest.mark.asyncio
+async def test_streamed_events_are_read_as_they_arrive():
+    result = LocalResult([Record({"row": get_row(event_id)}) for event_id in (1, 2, 3)])
+    session = LocalSession(lambda query, parameters: result)
+    events = EventRepository(session).iterate_events(3, 0, is_stream=True)
+
+    first = await events.__anext__()
+
+    assert first.id == 1
+    assert result.fetched == 1
+    assert [event.id async for event in events] == [2, 3]
+    assert result.fetched == 3
+    assert session.queries == [("explicit", GET_EVENTS_QUERY)]
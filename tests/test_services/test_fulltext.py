@@ -0,0 +1,33 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+
+from app.services.fulltext import escape_query
+
+
+@pytest.mark.parametrize(
+    "query, escaped",
+    [
+        ("  ride to Minsk ", "ride to Minsk"),
+        ("title:ride", "title\\:ride"),
+        ("ride AND (night || day)", "ride and \\(night \\|\\| day\\)"),
+        ("a && b -c +d NOT", "a \\&\\& b \\-c \\+d not"),
+        ("\"exact\" ~2 *", "\\\"exact\\\" \\~2 \\*"),
+        ("path/to\\file", "path\\/to\\\\file"),
+    ],
+)
+def test_escape_query(query: str, escaped: str):
+    assert escape_query(query) == escaped
@@ -0,0 +1,45 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from app.services.geo import get_bounding_box, get_distance_km
+
+
+def test_bounding_box_contains_the_radius():
+    bounding_box = get_bounding_box(53.9, 27.56, 10)
+
+    assert bounding_box.south < 53.9 < bounding_box.north
+    assert bounding_box.west < 27.56 < bounding_box.east
+    assert get_distance_km(53.9, 27.56, bounding_box.north, 27.56) == pytest.approx(10)
+    assert get_distance_km(53.9, 27.56, bounding_box.south, 27.56) == pytest.approx(10)
+    assert get_distance_km(53.9, 27.56, 53.9, bounding_box.east) >= 10
+
+
+@pytest.mark.parametrize("longitude", [179.95, -179.95])
+def test_bounding_box_wraps_around_the_antimeridian(longitude):
+    bounding_box = get_bounding_box(0.0, longitude, 50)
+
+    assert bounding_box.west > bounding_box.east
+    assert -180.0 <= bounding_box.west <= 180.0
+    assert -180.0 <= bounding_box.east <= 180.0
+
+
+@pytest.mark.parametrize(("latitude", "south", "north"), [(89.9, 89.9 - 0.45, 90.0), (-89.9, -90.0, -89.9 + 0.45)])
+def test_bounding_box_is_clamped_at_the_poles(latitude, south, north):
+    bounding_box = get_bounding_box(latitude, 27.56, 50)
+
+    assert bounding_box.south == pytest.approx(south, abs=0.01)
+    assert bounding_box.north == pytest.approx(north, abs=0.01)
+    assert (bounding_box.west, bounding_box.east) == (-180.0, 180.0)
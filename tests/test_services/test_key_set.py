@@ -0,0 +1,93 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import json
+import os
+import time
+
+from pathlib import Path
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwk, jwt
+
+from app.services.key_set import KeySet
+from app.services.token import JWT_ACCESS_SUBJECT, get_user_id_from_access_token
+
+
+def _generate_rsa_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _private_pem(private_key) -> str:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def _public_pem(private_key) -> str:
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+
+
+def _create_token(private_key, algorithm: str, kid: str | None = None, user_id: int = 1) -> str:
+    claims = {"user_id": user_id, "username": "rider", "sub": JWT_ACCESS_SUBJECT, "exp": int(time.time()) + 60}
+    headers = {"kid": kid} if kid else None
+    return jwt.encode(claims, _private_pem(private_key), algorithm=algorithm, headers=headers)
+
+
+def test_key_set_verifies_pem_key(tmp_path: Path):
+    private_key = _generate_rsa_key()
+    path = tmp_path / "public_key.pem"
+    path.write_text(_public_pem(private_key))
+
+    key_set = KeySet(path, ["RS512"])
+
+    assert get_user_id_from_access_token(_create_token(private_key, "RS512", user_id=7), key_set) == 7
+    assert get_user_id_from_access_token(_create_token(private_key, "RS256"), key_set) is None
+
+
+def test_key_set_selects_key_by_kid(tmp_path: Path):
+    rsa_key = _generate_rsa_key()
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    path = tmp_path / "keys.json"
+    path.write_text(json.dumps({"keys": [
+        {**jwk.construct(_public_pem(rsa_key), "RS512").to_dict(), "kid": "old"},
+        {**jwk.construct(_public_pem(ec_key), "ES256").to_dict(), "kid": "new"},
+    ]}))
+
+    key_set = KeySet(path, ["RS512", "ES256"])
+
+    assert get_user_id_from_access_token(_create_token(rsa_key, "RS512", "old", 1), key_set) == 1
+    assert get_user_id_from_access_token(_create_token(ec_key, "ES256", "new", 2), key_set) == 2
+    assert get_user_id_from_access_token(_create_token(ec_key, "ES256", "old"), key_set) is None
+
+
+def test_key_set_reloads_changed_file(tmp_path: Path):
+    old_key = _generate_rsa_key()
+    new_key = _generate_rsa_key()
+    path = tmp_path / "public_key.pem"
+    path.write_text(_public_pem(old_key))
+
+    key_set = KeySet(path, ["RS512"], reload_interval=0)
+
+    path.write_text(_public_pem(new_key))
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+    assert get_user_id_from_access_token(_create_token(new_key, "RS512"), key_set) == 1
+    assert get_user_id_from_access_token(_create_token(old_key, "RS512"), key_set) is None
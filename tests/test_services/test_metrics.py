@@ -0,0 +1,72 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+
+from app.database.repositories.event_repository import EventRepository
+from app.services.metrics import REGISTRY, Counter, Gauge, Histogram, Metric, MetricsRegistry
+from tests.fakes import LocalSession
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("request_seconds", "Request latency.", ("route",), buckets=(0.1, 1.0)))
+
+    histogram.observe(0.05, "/events")
+    histogram.observe(0.5, "/events")
+    histogram.observe(5.0, "/events")
+
+    assert registry.render().splitlines() == [
+        "# HELP request_seconds Request latency.",
+        "# TYPE request_seconds histogram",
+        'request_seconds_bucket{route="/events",le="0.1"} 1',
+        'request_seconds_bucket{route="/events",le="1.0"} 2',
+        'request_seconds_bucket{route="/events",le="+Inf"} 3',
+        'request_seconds_sum{route="/events"} 5.55',
+        'request_seconds_count{route="/events"} 3',
+    ]
+
+
+def test_counter_and_gauge_render_labels():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("checks_total", "Checks.", ("result",)))
+    gauge = registry.register(Gauge("opened_total", "Opened.", kind="counter"))
+
+    counter.inc("valid")
+    counter.inc("valid")
+    counter.inc('in"valid')
+    gauge.set(7)
+
+    assert registry.render().splitlines() == [
+        "# HELP checks_total Checks.",
+        "# TYPE checks_total counter",
+        'checks_total{result="valid"} 2.0',
+        'checks_total{result="in\\"valid"} 1.0',
+        "# HELP opened_total Opened.",
+        "# TYPE opened_total counter",
+        "opened_total 7.0",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_query_metrics_are_labelled_with_the_public_operation():
+    assert await EventRepository(LocalSession()).get_event_by_id(1) is None
+
+    assert 'neo4j_query_duration_seconds_count{repository="EventRepository",method="get_event_by_id"}' in REGISTRY.render()
+
+
+def test_metric_is_abstract():
+    with pytest.raises(TypeError):
+        Metric("requests_total", "Requests.")
@@ -0,0 +1,61 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import re
+
+from datetime import datetime, timedelta, timezone
+
+from app.database.migrations import MIGRATIONS
+from app.database.repositories.event_repository import EventRepository
+
+TIMEZONE = re.compile(r"SET event\.(\w+) = datetime\(\{datetime: event\.\1, timezone: '([^']+)'\}\)")
+
+
+def _to_cypher_string(value: datetime, zone: str) -> str:
+    # Mirrors Cypher's toString(): a zero offset renders as "Z", a named zone is appended in brackets.
+    value = value.astimezone(timezone.utc)
+    suffix = "Z" if re.fullmatch(r"[+-]00:00", zone) else f"Z[{zone}]"
+
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f") + suffix
+
+
+def test_utc_migrations_keep_event_rows_mappable():
+    local_time = datetime(2024, 5, 1, 10, 0, tzinfo=timezone(timedelta(hours=3)))
+
+    for migration in MIGRATIONS:
+        zones = dict(TIMEZONE.findall("\n".join(migration.statements)))
+        if not zones:
+            continue
+
+        assert set(zones) == {"start_at", "created_at", "updated_at"}
+
+        row = {
+            "id": 1,
+            "title": "Ride",
+            "subtitle": "",
+            "text": "Ride",
+            "picture": "https://example.com/ride.png",
+            "location": {"name": "", "description": "", "address": "", "latitude": 53.9, "longitude": 27.56},
+            **{name: _to_cypher_string(local_time, zone) for name, zone in zones.items()},
+        }
+
+        event = EventRepository.get_event_from_record({"row": row})
+
+        assert event.start_at == local_time
+        assert event.start_at.utcoffset() == timedelta(0)
+
+
+def test_migrations_are_numbered_once_each():
+    assert [migration.version for migration in MIGRATIONS] == list(range(1, len(MIGRATIONS) + 1))
+    assert len({tuple(migration.statements) for migration in MIGRATIONS}) == len(MIGRATIONS)
@@ -0,0 +1,40 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from typing import AsyncIterator, List
+
+from app.services.ndjson import iterate_lines
+
+
+async def _iterate_chunks(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_lines_split_across_chunks_are_joined():
+    chunks = [b'{"title": "Ri', b'de"}\n{"ti', b"tle", b'": "Run"}\n', b"\n  \n", b'{"title": "Last"}']
+
+    lines = [line async for line in iterate_lines(_iterate_chunks(chunks))]
+
+    assert lines == [b'{"title": "Ride"}', b'{"title": "Run"}', b'{"title": "Last"}']
+
+
+@pytest.mark.asyncio
+async def test_several_lines_in_one_chunk():
+    lines = [line async for line in iterate_lines(_iterate_chunks([b"1\n2\r\n3\n"]))]
+
+    assert lines == [b"1", b"2\r", b"3"]
@@ -0,0 +1,147 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+import time
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+from neo4j import Record
+
+from app.services.read_model import EventReadModel
+from tests.fakes import LocalPool, LocalResult, LocalSession, get_row
+
+
+class LocalStore:
+    def __init__(self) -> None:
+        self.rows: Dict[int, dict] = {}
+        self.pool = LocalPool(LocalSession(self.answer))
+
+    def answer(self, query: str, parameters: Dict[str, Any]) -> LocalResult:
+        if "updated_after" in parameters:
+            updated_after = parameters["updated_after"]
+            rows = [row for row in self.rows.values() if datetime.fromisoformat(row["updated_at"]) >= updated_after]
+            return LocalResult([Record({"row": row}) for row in rows])
+
+        if "event_ids" in parameters:
+            return LocalResult([Record({"row": self.rows[event_id]}) for event_id in parameters["event_ids"]])
+
+        return LocalResult([Record({"event_id": event_id}) for event_id in self.rows])
+
+
+@pytest.mark.asyncio
+async def test_read_model_syncs_changes_and_deletes():
+    now = datetime.now(timezone.utc)
+    store = LocalStore()
+    store.rows[1] = get_row(1, now + timedelta(days=2), 53.9, 27.56, now)
+    store.rows[2] = get_row(2, now + timedelta(days=1), 53.91, 27.55, now)
+    store.rows[3] = get_row(3, now + timedelta(days=3), 55.75, 37.62, now)
+
+    read_model = EventReadModel(store.pool, poll_interval=1, reconcile_interval=0, sync_overlap=5, cell_size=0.5)
+    await read_model.sync()
+
+    events = await read_model.get_events(10, 0, starts_after=now)
+    assert [event.id for event in events] == [2, 1, 3]
+
+    events = await read_model.get_events(10, 0, (events[0].start_at, events[0].id), starts_before=now + timedelta(days=3))
+    assert [event.id for event in events] == [1]
+
+    events = await read_model.get_events_near(53.9, 27.56, 5, 10, 0, starts_after=now)
+    assert [event.id for event in events] == [1, 2]
+
+    store.rows[2] = get_row(2, now + timedelta(days=4), 53.9, 27.56, now + timedelta(seconds=1))
+    del store.rows[3]
+    await read_model.sync()
+
+    events = await read_model.get_events(10, 0, starts_after=now)
+    assert [event.id for event in events] == [1, 2]
+    assert read_model.stats().size == 2
+    assert read_model.stats().syncs == 2
+
+
+@pytest.mark.asyncio
+async def test_read_model_covers_only_its_window():
+    read_model = EventReadModel(LocalStore().pool, poll_interval=1, reconcile_interval=0, sync_overlap=5, cell_size=0.5)
+
+    assert not read_model.covers(datetime.now(timezone.utc))
+
+    await read_model.sync()
+
+    assert read_model.covers(datetime.now(timezone.utc) + timedelta(seconds=1))
+    assert not read_model.covers(datetime.now(timezone.utc) - timedelta(days=1))
+    assert not read_model.covers(None)
+
+
+@pytest.mark.asyncio
+async def test_read_model_reconciles_first_sync_on_a_fresh_host(monkeypatch):
+    now = datetime.now(timezone.utc)
+    store = LocalStore()
+    store.rows[1] = get_row(1, now + timedelta(days=1), 53.9, 27.56, now)
+    store.rows[2] = get_row(2, now + timedelta(days=2), 53.9, 27.56, now)
+
+    monotonic = 12.0
+    monkeypatch.setattr(time, "monotonic", lambda: monotonic)
+
+    read_model = EventReadModel(store.pool, poll_interval=1, reconcile_interval=30, sync_overlap=5, cell_size=0.5)
+    await read_model.sync()
+
+    assert read_model.covers(now + timedelta(seconds=1))
+    assert read_model.stats().size == 2
+
+    del store.rows[2]
+    await read_model.sync()
+    assert read_model.stats().size == 2
+
+    monotonic += 30
+    await read_model.sync()
+    assert read_model.stats().size == 1
+
+
+@pytest.mark.asyncio
+async def test_read_model_reconcile_loads_events_the_poll_missed():
+    now = datetime.now(timezone.utc)
+    store = LocalStore()
+    store.rows[1] = get_row(1, now + timedelta(days=1), 53.9, 27.56, now)
+
+    read_model = EventReadModel(store.pool, poll_interval=1, reconcile_interval=30, sync_overlap=5, cell_size=0.5)
+    await read_model.sync()
+
+    # Written by a host whose clock lags well behind the overlap.
+    store.rows[2] = get_row(2, now + timedelta(days=2), 53.9, 27.56, now - timedelta(minutes=1))
+    await read_model.sync()
+
+    assert [event.id for event in await read_model.get_events(10, 0, starts_after=now)] == [1]
+
+    read_model._reconciled_at -= 30
+    await read_model.sync()
+
+    assert [event.id for event in await read_model.get_events(10, 0, starts_after=now)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_read_model_drops_events_moved_into_the_past():
+    now = datetime.now(timezone.utc)
+    store = LocalStore()
+    store.rows[1] = get_row(1, now + timedelta(days=1), 53.9, 27.56, now)
+    store.rows[2] = get_row(2, now + timedelta(days=2), 53.9, 27.56, now)
+
+    read_model = EventReadModel(store.pool, poll_interval=1, reconcile_interval=30, sync_overlap=5, cell_size=0.5)
+    await read_model.sync()
+
+    store.rows[2] = get_row(2, now - timedelta(days=1), 53.9, 27.56, now + timedelta(seconds=1))
+    await read_model.sync()
+
+    assert [event.id for event in await read_model.get_events(10, 0, starts_after=now)] == [1]
+    assert await read_model.get_events_near(53.9, 27.56, 5, 10, 0) == await read_model.get_events(10, 0)
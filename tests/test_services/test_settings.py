@@ -0,0 +1,37 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+
+from pydantic import ValidationError
+
+from app.core.settings.app import AppSettings
+
+
+def test_memory_cache_is_refused_with_several_workers():
+    with pytest.raises(ValidationError, match="cache_backend"):
+        AppSettings(server_workers=2, cache_backend="memory", metrics_enabled=False)
+
+
+def test_metrics_are_refused_with_several_workers():
+    with pytest.raises(ValidationError, match="metrics_enabled"):
+        AppSettings(server_workers=2, cache_backend="none", metrics_enabled=True)
+
+
+@pytest.mark.parametrize("cache_backend", ["none", "redis"])
+def test_shared_or_no_cache_is_allowed_with_several_workers(cache_backend: str):
+    settings = AppSettings(server_workers=2, cache_backend=cache_backend, metrics_enabled=False)
+
+    assert settings.server_kwargs["workers"] == 2
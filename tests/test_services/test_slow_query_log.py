@@ -0,0 +1,127 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import pytest
+
+from app.services.slow_query_log import SlowQueryLog, get_query_hash, redact
+from tests.fakes import LocalPool, LocalResult, LocalSession, get_summary
+
+PROFILE = {
+    "operatorType": "ProduceResults",
+    "rows": 1,
+    "dbHits": 2,
+    "children": [{"operatorType": "NodeIndexSeek", "rows": 1, "dbHits": 3, "children": []}],
+}
+
+
+def get_profile_pool() -> LocalPool:
+    return LocalPool(LocalSession(lambda query, parameters: LocalResult(summary=get_summary("r", PROFILE))))
+
+
+def get_slow_query_log(pool: LocalPool, threshold: float = 0, profile_interval: float = 300) -> SlowQueryLog:
+    return SlowQueryLog(pool, threshold=threshold, max_size=10, is_profile_enabled=True, profile_interval=profile_interval)
+
+
+def capture(slow_query_log: SlowQueryLog, duration: float, query_type: str = "r") -> None:
+    slow_query_log.capture(
+        "MATCH (event) RETURN id(event) AS event_id",
+        {"title": "Ride"},
+        "EventRepository.get",
+        duration,
+        1,
+        get_summary(query_type),
+    )
+
+
+def test_redact_keeps_only_shapes():
+    assert redact({"title": "Ride", "location": {"latitude": 53.9}, "events": [1, 2], "picture": None}) == {
+        "title": "<str>",
+        "location": {"latitude": "<float>"},
+        "events": "<list[2]>",
+        "picture": None,
+    }
+
+
+def test_query_hash_ignores_whitespace():
+    assert get_query_hash("MATCH (event)\n    RETURN event") == get_query_hash("MATCH (event) RETURN event")
+
+
+@pytest.mark.asyncio
+async def test_slow_read_query_is_profiled_in_background():
+    pool = get_profile_pool()
+    slow_query_log = get_slow_query_log(pool)
+
+    capture(slow_query_log, 0.7)
+
+    assert pool.local_session.queries == []
+
+    await asyncio.gather(*slow_query_log._tasks)
+
+    assert pool.local_session.queries == [("read", "PROFILE MATCH (event) RETURN id(event) AS event_id")]
+
+    slow_query, = slow_query_log.get_slowest(10)
+    assert slow_query.duration_ms == 700
+    assert slow_query.records == 1
+    assert slow_query.db_hits == 5
+    assert slow_query.plan == ["ProduceResults rows=1 db_hits=2", "  NodeIndexSeek rows=1 db_hits=3"]
+    assert slow_query.parameters == {"title": "<str>"}
+
+
+@pytest.mark.asyncio
+async def test_profile_runs_once_per_interval():
+    pool = get_profile_pool()
+    slow_query_log = get_slow_query_log(pool)
+
+    capture(slow_query_log, 0.7)
+    await asyncio.gather(*slow_query_log._tasks)
+    capture(slow_query_log, 0.9)
+
+    assert not slow_query_log._tasks
+    assert len(pool.local_session.queries) == 1
+    assert slow_query_log.get_slowest(10)[0].duration_ms == 900
+
+
+@pytest.mark.asyncio
+async def test_query_that_is_not_slower_is_not_profiled():
+    pool = get_profile_pool()
+    slow_query_log = get_slow_query_log(pool, profile_interval=0)
+
+    capture(slow_query_log, 0.9)
+    await asyncio.gather(*slow_query_log._tasks)
+    capture(slow_query_log, 0.7)
+
+    assert not slow_query_log._tasks
+    assert len(pool.local_session.queries) == 1
+    assert slow_query_log.get_slowest(10)[0].duration_ms == 900
+
+
+@pytest.mark.asyncio
+async def test_write_query_is_not_profiled():
+    pool = get_profile_pool()
+    slow_query_log = get_slow_query_log(pool)
+
+    capture(slow_query_log, 0.7, "w")
+
+    assert not slow_query_log._tasks
+    assert slow_query_log.get_slowest(10)[0].db_hits is None
+
+
+def test_fast_query_is_not_recorded():
+    slow_query_log = get_slow_query_log(get_profile_pool(), threshold=60)
+
+    capture(slow_query_log, 0.1)
+
+    assert slow_query_log.get_slowest(10) == []
@@ -0,0 +1,35 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from app.resources.strings_factory import get_language, negotiate_language
+
+
+@pytest.mark.parametrize(("accept_language", "language"), [
+    ("ru", "ru"),
+    ("ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7", "ru"),
+    ("en-US,en;q=0.9,ru;q=0.8", "en"),
+    ("de-DE,de;q=0.9,ru;q=0.5", "ru"),
+    ("ru;q=0, en;q=0.1", "en"),
+    ("en;q=0.5, ru;q=0.5", "en"),
+    ("*", "en"),
+    ("", "en"),
+])
+def test_language_is_negotiated_by_quality(accept_language, language):
+    assert negotiate_language(accept_language) == language
+
+
+def test_string_tables_are_shared():
+    assert get_language("ru-RU") is get_language("ru")
@@ -0,0 +1,52 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import time
+
+from app.services.token_cache import TokenCache
+
+
+def test_token_cache_hit_and_miss():
+    token_cache = TokenCache(max_size=2)
+
+    assert token_cache.get("token") is None
+
+    token_cache.set("token", 1, time.time() + 60)
+
+    assert token_cache.get("token") == 1
+    assert token_cache.stats().hits == 1
+    assert token_cache.stats().misses == 1
+
+
+def test_token_cache_expired_entry():
+    token_cache = TokenCache(max_size=2)
+    token_cache.set("token", 1, time.time() - 1)
+
+    assert token_cache.get("token") is None
+    assert token_cache.stats().size == 0
+
+
+def test_token_cache_evicts_least_recently_used():
+    token_cache = TokenCache(max_size=2)
+    expires_at = time.time() + 60
+
+    token_cache.set("first", 1, expires_at)
+    token_cache.set("second", 2, expires_at)
+    token_cache.get("first")
+    token_cache.set("third", 3, expires_at)
+
+    assert token_cache.get("first") == 1
+    assert token_cache.get("second") is None
+    assert token_cache.get("third") == 3
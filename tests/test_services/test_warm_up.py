@@ -0,0 +1,53 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from app.database.repositories import event_repository
+from app.database.repositories.event_repository import EventRepository
+from tests.fakes import LocalResult, LocalSession
+
+
+@pytest.mark.asyncio
+async def test_warm_up_explains_every_repository_query():
+    session = LocalSession()
+
+    count = await EventRepository(session).warm_up()
+
+    queries = {name: value for name, value in vars(event_repository).items() if name.endswith("_QUERY")}
+    explained = {query.removeprefix("EXPLAIN "): access_mode for access_mode, query in session.queries}
+
+    assert count == len(session.queries) == len(queries)
+    assert all(query.startswith("EXPLAIN ") for _, query in session.queries)
+    assert set(explained) == set(queries.values())
+    assert explained[event_repository.CREATE_EVENT_QUERY] == "write"
+    assert explained[event_repository.GET_EVENTS_QUERY] == "read"
+
+
+def _answer_without_index(query: str, parameters: dict) -> LocalResult:
+    if query == f"EXPLAIN {event_repository.GET_EVENTS_QUERY}":
+        raise RuntimeError("Unknown index")
+
+    return LocalResult()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_continues_after_a_failed_query():
+    session = LocalSession(_answer_without_index)
+
+    count = await EventRepository(session).warm_up()
+
+    queries = [name for name, value in vars(event_repository).items() if name.endswith("_QUERY")]
+
+    assert count == len(session.queries) - 1 == len(queries) - 1